@@ -5,15 +5,36 @@ This hook injects the benchmark task context and question into the Claude sessio
 It reads the current task from the benchmark state file.
 """
 
-import json
+import mmap
 import os
+import sys
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-def get_state_file() -> Path:
-    """Get the benchmark state file path."""
-    state_dir = Path(os.environ.get("OOLONG_STATE_DIR", "/tmp/oolong-pairs"))
-    return state_dir / "current_task.json"
+from oolong_pairs.state import get_state_file, read_state, write_state
+from oolong_pairs.truncation import TRUNCATION_MARKER, truncation_cuts
+
+# Fixed scaffolding of the truncation-strategy injection, pre-encoded once
+_TASK_OPEN = b'<benchmark-task id="'
+_CONTEXT_OPEN = b"""">
+You are being evaluated on a long-context reasoning benchmark.
+
+<context>
+"""
+_QUESTION_OPEN = b"""
+</context>
+
+<question>
+"""
+_TASK_CLOSE = b"""
+</question>
+
+Analyze the context above and answer the question.
+Output ONLY the final answer on a single line prefixed with "ANSWER: "
+</benchmark-task>
+"""
 
 
 def main() -> None:
@@ -24,10 +45,8 @@ def main() -> None:
         # No benchmark running, exit silently
         return
 
-    try:
-        with open(state_file) as f:
-            task_data = json.load(f)
-    except (json.JSONDecodeError, OSError):
+    task_data = read_state(state_file)
+    if task_data is None:
         return
 
     # Check if task is active
@@ -36,19 +55,21 @@ def main() -> None:
 
     # Mark task as in progress
     task_data["status"] = "in_progress"
-    with open(state_file, "w") as f:
-        json.dump(task_data, f)
+    write_state(state_file, task_data)
 
     # Build the injection prompt
-    context = task_data.get("context", "")
     question = task_data.get("question", "")
     task_id = task_data.get("task_id", "unknown")
     strategy = task_data.get("strategy", "truncation")
 
-    # Write context to a temp file for rlm-rs to load
-    state_dir = get_state_file().parent
-    context_file = state_dir / f"context_{task_id}.txt"
-    context_file.write_text(context)
+    # The orchestrator writes the context once to its own file; inline
+    # "context" is still accepted for hand-written state files
+    context_path = task_data.get("context_path")
+    if context_path:
+        context_file = Path(context_path)
+    else:
+        context_file = state_file.parent / f"context_{task_id}.txt"
+        context_file.write_text(task_data.get("context", ""), encoding="utf-8")
 
     if strategy == "rlm_rs":
         # Prompt Claude to use the rlm-rs plugin
@@ -65,31 +86,41 @@ The plugin will chunk the document, run subcalls on relevant chunks, and synthes
 
 After getting the synthesized answer, output ONLY the final answer on a single line prefixed with "ANSWER: "
 </benchmark-task>"""
-    else:
-        # Truncation strategy - direct context injection
-        # Truncate to ~180k chars, keeping first 60% and last 40%
-        max_chars = 180_000
-        if len(context) > max_chars:
-            first_part = int(max_chars * 0.6)
-            last_part = max_chars - first_part
-            context = context[:first_part] + "\n\n[... content truncated ...]\n\n" + context[-last_part:]
-
-        injection = f"""<benchmark-task id="{task_id}">
-You are being evaluated on a long-context reasoning benchmark.
-
-<context>
-{context}
-</context>
-
-<question>
-{question}
-</question>
-
-Analyze the context above and answer the question.
-Output ONLY the final answer on a single line prefixed with "ANSWER: "
-</benchmark-task>"""
+        print(injection)
+        return
 
-    print(injection)
+    # Truncation strategy - direct context injection, written as bytes straight
+    # to stdout so the (possibly truncated) context is never copied into one
+    # large string or re-encoded by the text layer
+    out = sys.stdout.buffer
+    out.write(_TASK_OPEN)
+    out.write(task_id.encode())
+    out.write(_CONTEXT_OPEN)
+
+    # Truncate to ~180k bytes, keeping first 60% and last 40%. The file is
+    # mapped and only the kept head and tail pages are written out, however
+    # large the context is
+    max_bytes = 180_000
+    with open(context_file, "rb") as f:
+        size = task_data.get("context_len") or os.fstat(f.fileno()).st_size
+        if size:
+            with (
+                mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                cuts = truncation_cuts(mapped, max_bytes)
+                if cuts is None:
+                    out.write(view)
+                else:
+                    head_end, tail_start = cuts
+                    out.write(view[:head_end])
+                    out.write(TRUNCATION_MARKER)
+                    out.write(view[tail_start:])
+
+    out.write(_QUESTION_OPEN)
+    out.write(question.encode())
+    out.write(_TASK_CLOSE)
+    out.flush()
 
 
 if __name__ == "__main__":
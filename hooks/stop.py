@@ -5,8 +5,8 @@ This hook captures the final answer from the Claude session and scores it.
 It reads from stdin the session data passed by Claude Code.
 """
 
-import json
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -16,13 +16,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from oolong_pairs.models import Result, Strategy
 from oolong_pairs.scoring import score_answer, map_answer_type_str
+from oolong_pairs.serialization import loads
+from oolong_pairs.state import get_state_file, read_state, write_state
 from oolong_pairs.storage import Storage
 
-
-def get_state_file() -> Path:
-    """Get the benchmark state file path."""
-    state_dir = Path(os.environ.get("OOLONG_STATE_DIR", "/tmp/oolong-pairs"))
-    return state_dir / "current_task.json"
+# Matches an "ANSWER: ..." line anywhere in the text, case-insensitively
+_ANSWER_RE = re.compile(r"^[ \t]*ANSWER:[ \t]*(.*?)[ \t\r]*$", re.IGNORECASE | re.MULTILINE)
 
 
 def get_db_path() -> Path:
@@ -37,12 +36,20 @@ def extract_answer(session_data: dict) -> str:
     """
 
     def find_answer_line(text: str) -> str | None:
-        """Find line with ANSWER: prefix."""
-        for line in text.split("\n"):
-            line = line.strip()
-            if line.upper().startswith("ANSWER:"):
-                return line[7:].strip()  # Remove "ANSWER:" prefix
-        return None
+        """Find the last line with ANSWER: prefix."""
+        # Fast path: the prompt asks for an upper-case ANSWER: line at the end,
+        # so the case-insensitive scan can start at the last such line
+        start = 0
+        idx = text.rfind("ANSWER:")
+        if idx != -1:
+            line_start = text.rfind("\n", 0, idx) + 1
+            if not text[line_start:idx].strip(" \t"):
+                start = line_start
+
+        last = None
+        for match in _ANSWER_RE.finditer(text, start):
+            last = match
+        return last.group(1) if last else None
 
     # Try final_summary first
     final_summary = session_data.get("final_summary", "")
@@ -84,10 +91,8 @@ def main() -> None:
         # No benchmark running
         return
 
-    try:
-        with open(state_file) as f:
-            task_data = json.load(f)
-    except (json.JSONDecodeError, OSError):
+    task_data = read_state(state_file)
+    if task_data is None:
         return
 
     # Check if task is in progress
@@ -95,10 +100,11 @@ def main() -> None:
         return
 
     # Read session data from stdin
+    # Parse the raw bytes directly, skipping a text decode of the transcript
     try:
-        session_input = sys.stdin.read()
-        session_data = json.loads(session_input) if session_input else {}
-    except json.JSONDecodeError:
+        session_input = sys.stdin.buffer.read()
+        session_data = loads(session_input) if session_input else {}
+    except ValueError:
         session_data = {}
 
     # Extract the actual answer
@@ -132,14 +138,16 @@ def main() -> None:
     # Save to database
     db_path = get_db_path()
     storage = Storage(db_path)
-    storage.save_result(result)
+    try:
+        storage.save_result(result)
+    finally:
+        storage.close()
 
     # Mark task as completed
     task_data["status"] = "completed"
     task_data["actual_answer"] = actual_answer
     task_data["score"] = score
-    with open(state_file, "w") as f:
-        json.dump(task_data, f)
+    write_state(state_file, task_data)
 
     # Output result summary
     print(f"[oolong-pairs] Task {task_id}: score={score:.4f}")
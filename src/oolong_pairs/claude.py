@@ -0,0 +1,80 @@
+"""Claude CLI invocation shared by strategies and the orchestrator."""
+
+import shutil
+import subprocess
+
+from .serialization import loads
+
+
+class ClaudeSession:
+    """Claude CLI invocation bound to one model and output format.
+
+    `claude --print` answers a single prompt and exits, and a long-lived
+    stream-json session would carry conversation history from one task into
+    the next, so every prompt still runs the CLI once. The session resolves
+    the executable and builds the argument list a single time and is meant
+    to be created once per strategy or orchestrator.
+
+    Calls avoid `preexec_fn` and user or group changes, so on Linux CPython
+    launches the CLI with vfork rather than copying the interpreter.
+    `close_fds` keeps its default: descriptors that extensions open without
+    CLOEXEC (such as the watchdog inotify fd) must not reach the CLI or its
+    hooks.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        output_format: str = "json",
+        timeout: float = 300,
+        env: dict[str, str] | None = None,
+    ):
+        self.model = model
+        self.output_format = output_format
+        self.timeout = timeout
+        self.env = env
+        self._args = [
+            shutil.which("claude") or "claude",
+            "--print",
+            "--model",
+            model,
+            "--output-format",
+            output_format,
+        ]
+
+    def run(
+        self,
+        prompt: str | bytes,
+        timeout: float | None = None,
+        env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Send a prompt to the CLI and return the completed process.
+
+        A bytes prompt (already UTF-8) is written as-is and its output is left
+        as bytes. `env` replaces the session environment for this call only.
+        """
+        return subprocess.run(
+            self._args,
+            input=prompt,
+            capture_output=True,
+            text=isinstance(prompt, str),
+            timeout=timeout or self.timeout,
+            env=env or self.env,
+        )
+
+
+def parse_json_output(stdout: str | bytes) -> tuple[str, int]:
+    """Extract the answer and output token count from `--output-format json`.
+
+    Bytes output is parsed as-is, without decoding it to a str first.
+    """
+    try:
+        output = loads(stdout)
+        answer = output.get("result", "").strip()
+        tokens = output.get("usage", {}).get("output_tokens", 0)
+        return answer, tokens
+    except ValueError:
+        # Fall back to raw output
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode(errors="replace")
+        return stdout.strip(), 0
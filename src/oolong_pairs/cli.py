@@ -1,6 +1,7 @@
 """CLI interface for OOLONG-Pairs benchmark."""
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -10,7 +11,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .dataset import get_dataset_stats, load_oolong_tasks
-from .models import BenchmarkRun, ExecutionMode, Strategy
+from .models import BenchmarkRun, ExecutionMode, Result, Strategy
 from .storage import Storage
 from .strategies import get_strategy
 
@@ -25,6 +26,7 @@ def cli(ctx: click.Context, db: str) -> None:
     ctx.ensure_object(dict)
     ctx.obj["db_path"] = Path(db)
     ctx.obj["storage"] = Storage(Path(db))
+    ctx.call_on_close(ctx.obj["storage"].close)
 
 
 @cli.command()
@@ -48,6 +50,18 @@ def cli(ctx: click.Context, db: str) -> None:
     help="Minimum context length in chars",
 )
 @click.option("--dataset", default="trec_coarse", help="Dataset filter")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of tasks to execute in parallel",
+)
+@click.option(
+    "--flush-every",
+    type=click.IntRange(min=1),
+    default=32,
+    help="Save results to the database in batches of this size",
+)
 @click.pass_context
 def run(
     ctx: click.Context,
@@ -56,6 +70,8 @@ def run(
     limit: int | None,
     min_context: int,
     dataset: str,
+    concurrency: int,
+    flush_every: int,
 ) -> None:
     """Run benchmark with specified strategy."""
     storage: Storage = ctx.obj["storage"]
@@ -79,6 +95,7 @@ def run(
     console.print(f"  Mode: {mode_enum.value}")
     console.print(f"  Dataset filter: {dataset}")
     console.print(f"  Min context: {min_context:,} chars")
+    console.print(f"  Concurrency: {concurrency}")
     console.print()
 
     # Load tasks
@@ -107,29 +124,59 @@ def run(
     ) as progress:
         task_progress = progress.add_task(f"Running {len(tasks)} tasks...", total=len(tasks))
 
-        for i, task in enumerate(tasks):
-            progress.update(
-                task_progress,
-                description=f"Task {i + 1}/{len(tasks)}: {task.id[:16]}...",
+        # Tasks are I/O-bound on the Claude CLI, so run them in worker threads;
+        # results are saved and reported from this thread only
+        pending: list[Result] = []
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        futures = {pool.submit(exec_strategy.execute, task, run_id): task for task in tasks}
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                task = futures.pop(future)
+                progress.update(
+                    task_progress,
+                    description=f"Task {i + 1}/{len(tasks)}: {task.id[:16]}...",
+                )
+
+                try:
+                    result = future.result()
+                    pending.append(result)
+                    if len(pending) >= flush_every:
+                        storage.save_results(pending)
+                        pending.clear()
+
+                    if result.error:
+                        console.print(f"  [yellow]Task {task.id}: Error - {result.error}[/yellow]")
+                    else:
+                        score_color = (
+                            "green"
+                            if result.score >= 0.8
+                            else "yellow"
+                            if result.score >= 0.5
+                            else "red"
+                        )
+                        console.print(
+                            f"  Task {task.id}: [{score_color}]{result.score:.2f}[/{score_color}] "
+                            f"({result.latency_ms:.0f}ms)"
+                        )
+
+                except Exception as e:
+                    console.print(f"  [red]Task {task.id}: Exception - {e}[/red]")
+
+                progress.advance(task_progress)
+        except BaseException:
+            # On Ctrl-C (or any error) drop the queued tasks instead of
+            # waiting for each of them to make its Claude call, let the
+            # running ones finish, and keep the results they return
+            pool.shutdown(cancel_futures=True)
+            pending.extend(
+                future.result()
+                for future in futures
+                if not future.cancelled() and future.exception() is None
             )
-
-            try:
-                result = exec_strategy.execute(task, run_id)
-                storage.save_result(result)
-
-                if result.error:
-                    console.print(f"  [yellow]Task {task.id}: Error - {result.error}[/yellow]")
-                else:
-                    score_color = "green" if result.score >= 0.8 else "yellow" if result.score >= 0.5 else "red"
-                    console.print(
-                        f"  Task {task.id}: [{score_color}]{result.score:.2f}[/{score_color}] "
-                        f"({result.latency_ms:.0f}ms)"
-                    )
-
-            except Exception as e:
-                console.print(f"  [red]Task {task.id}: Exception - {e}[/red]")
-
-            progress.advance(task_progress)
+            raise
+        finally:
+            pool.shutdown()
+            storage.save_results(pending)
 
     # Update run stats
     storage.update_run_stats(run_id)
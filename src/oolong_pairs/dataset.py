@@ -1,22 +1,125 @@
 """Dataset loading for OOLONG benchmark."""
 
-from typing import Iterator
+import hashlib
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
 
+import pyarrow as pa
+import pyarrow.compute as pc
 from datasets import load_dataset
 
 from .models import AnswerType, Task
+from .scoring import map_answer_type_str
+
+DATASET_NAME = "oolongbench/oolong-synth"
+DEFAULT_CACHE_DIR = Path(".cache")
+DEFAULT_CONTEXT_DIR = DEFAULT_CACHE_DIR / "contexts"
+CACHE_BATCH_SIZE = 64
+# Bumped when the cached row layout changes, so older caches are not read
+CACHE_VERSION = 2
+
+# Columns read when building tasks; everything else is never decoded
+TASK_COLUMNS = [
+    "id",
+    "dataset",
+    "context_window_text",
+    "question",
+    "answer",
+    "answer_type",
+    "task",
+    "task_group",
+    "num_labels",
+    "context_window_id",
+    "input_subset",
+]
+STATS_COLUMNS = ["dataset", "task", "answer_type", "context_window_text"]
+STATS_BATCH_SIZE = 1_000
+
+
+def _select_columns(ds, columns: list[str]):
+    """Project a dataset onto the given columns, skipping any it lacks."""
+    available = ds.column_names
+    if available is None:
+        return ds
+    return ds.select_columns([c for c in columns if c in available])
+
+
+def _filter_dataset(ds, dataset_filter: str):
+    """Filter rows by dataset column, decoding only that column."""
+    if not dataset_filter:
+        return ds
+    return ds.filter(lambda name: name == dataset_filter, input_columns="dataset")
 
 
 def map_answer_type(answer_type_str: str) -> AnswerType:
-    """Map dataset answer_type string to AnswerType enum."""
-    mapping = {
-        "NUMERIC": AnswerType.NUMERIC,
-        "NUMERIC_ONE_CLASS": AnswerType.NUMERIC,
-        "LABEL": AnswerType.LABEL,
-        "COMPARISON": AnswerType.COMPARISON,
-        "DATE": AnswerType.DATE,
-    }
-    return mapping.get(answer_type_str.upper(), AnswerType.LABEL)
+    """Map dataset answer_type string to AnswerType enum.
+
+    Same mapping the Stop hook applies to the type in the state file.
+    """
+    return map_answer_type_str(answer_type_str)
+
+
+def context_file(task_id: str, context_dir: Path = DEFAULT_CONTEXT_DIR) -> Path:
+    """Get the absolute path a task's context is written to."""
+    return (context_dir / f"ctx_{task_id}.txt").resolve()
+
+
+def write_context(task_id: str, context: str, context_dir: Path = DEFAULT_CONTEXT_DIR) -> Path:
+    """Write a task context to disk once and return its absolute path."""
+    context_dir.mkdir(parents=True, exist_ok=True)
+    context_path = context_file(task_id, context_dir)
+    if not context_path.exists():
+        tmp_path = context_path.with_suffix(".tmp")
+        tmp_path.write_text(context, encoding="utf-8")
+        tmp_path.replace(context_path)
+    return context_path
+
+
+def _intern(value: Any) -> Any:
+    """Intern categorical string values so repeated rows share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _unbracket(value: Any) -> str:
+    """Drop the surrounding brackets of a list-repr answer like "['x']"."""
+    text = value if type(value) is str else str(value)
+    if len(text) >= 2 and text[0] == "[" and text[-1] == "]":
+        return text[1:-1]
+    return text
+
+
+def _row_to_task(row: dict, idx: int, context_dir: Path) -> Task:
+    """Build a Task from a dataset row, writing its context to context_dir.
+
+    Cached rows carry no context text; their context was written to
+    context_dir when the cache was built.
+    """
+    task_id = f"{row.get('id', idx)}"
+    if "context_window_text" in row:
+        context = row["context_window_text"] or ""
+        context_path = write_context(task_id, context, context_dir)
+        context_length = row.get("context_length") or len(context)
+    else:
+        context_path = context_file(task_id, context_dir)
+        context_length = row.get("context_length") or 0
+    return Task(
+        id=task_id,
+        dataset=_intern(row.get("dataset", "unknown")),
+        context_path=context_path,
+        question=row.get("question", ""),
+        expected_answer=_unbracket(row.get("answer", "")),
+        answer_type=map_answer_type(row.get("answer_type", "LABEL")),
+        context_length=context_length,
+        task_type=_intern(row.get("task", "")),
+        metadata={
+            "task_group": _intern(row.get("task_group", "")),
+            "num_labels": row.get("num_labels", 0),
+            "context_window_id": row.get("context_window_id", 0),
+            "input_subset": _intern(row.get("input_subset", "")),
+        },
+    )
 
 
 def load_oolong_tasks(
@@ -24,6 +127,8 @@ def load_oolong_tasks(
     split: str = "validation",
     min_context_length: int = 100_000,
     limit: int | None = None,
+    context_dir: Path = DEFAULT_CONTEXT_DIR,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
 ) -> list[Task]:
     """Load OOLONG tasks from HuggingFace.
 
@@ -32,92 +137,167 @@ def load_oolong_tasks(
         split: Dataset split ('validation' or 'test')
         min_context_length: Minimum context length in characters
         limit: Maximum number of tasks to load
+        context_dir: Directory where task contexts are written
+        cache_dir: Directory for the filtered row cache (None to disable)
 
     Returns:
         List of Task objects
     """
-    # Load dataset from HuggingFace
-    ds = load_dataset("oolongbench/oolong-synth", split=split)
-
-    tasks = []
-    for idx, row in enumerate(ds):
-        # Filter by dataset column
-        if dataset_filter and row.get("dataset") != dataset_filter:
-            continue
-
-        # Get context (prefer without labels for cleaner eval)
-        context = row.get("context_window_text", "")
-
-        # Filter by context length
-        if len(context) < min_context_length:
-            continue
-
-        # Create task
-        task = Task(
-            id=f"{row.get('id', idx)}",
-            dataset=row.get("dataset", "unknown"),
-            context=context,
-            question=row.get("question", ""),
-            expected_answer=str(row.get("answer", "")).strip("[]"),
-            answer_type=map_answer_type(row.get("answer_type", "LABEL")),
-            context_length=len(context),
-            task_type=row.get("task", ""),
-            metadata={
-                "task_group": row.get("task_group", ""),
-                "num_labels": row.get("num_labels", 0),
-                "context_window_id": row.get("context_window_id", 0),
-                "input_subset": row.get("input_subset", ""),
-            },
-        )
-        tasks.append(task)
-
-        if limit and len(tasks) >= limit:
-            break
-
-    return tasks
+    tasks = iter_oolong_tasks(
+        dataset_filter=dataset_filter,
+        split=split,
+        min_context_length=min_context_length,
+        context_dir=context_dir,
+        cache_dir=cache_dir,
+    )
+    return list(islice(tasks, limit or None))
 
 
 def iter_oolong_tasks(
     dataset_filter: str = "trec_coarse",
     split: str = "validation",
     min_context_length: int = 100_000,
+    context_dir: Path = DEFAULT_CONTEXT_DIR,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
 ) -> Iterator[Task]:
     """Iterate OOLONG tasks without loading all into memory.
 
+    The filtered rows are cached as an Arrow IPC file in cache_dir the first
+    time they are iterated to the end, and later calls with the same filters
+    memory-map the cache instead of streaming the split again. Contexts are
+    not cached, since each one is already in its file in context_dir; a
+    cache whose context files are gone is rebuilt.
+
     Args:
         dataset_filter: Filter by dataset column
         split: Dataset split
         min_context_length: Minimum context length
+        context_dir: Directory where task contexts are written
+        cache_dir: Directory for the filtered row cache (None to disable)
 
     Yields:
         Task objects one at a time
     """
-    ds = load_dataset("oolongbench/oolong-synth", split=split, streaming=True)
+    if cache_dir is None:
+        rows = _iter_dataset_rows(dataset_filter, split, min_context_length)
+    else:
+        cache_path = _cache_path(cache_dir, dataset_filter, split, min_context_length)
+        if cache_path.exists() and _cached_contexts_exist(cache_path, context_dir):
+            rows = _iter_cached_rows(cache_path)
+        else:
+            rows = _cache_rows(
+                _iter_dataset_rows(dataset_filter, split, min_context_length), cache_path
+            )
+
+    for idx, row in enumerate(rows):
+        yield _row_to_task(row, idx, context_dir)
+
+
+def _iter_dataset_rows(dataset_filter: str, split: str, min_context_length: int) -> Iterator[dict]:
+    """Stream filtered rows from HuggingFace, with ids and lengths filled in."""
+    ds = load_dataset(DATASET_NAME, split=split, streaming=True)
+    ds = _filter_dataset(_select_columns(ds, TASK_COLUMNS), dataset_filter)
 
     for idx, row in enumerate(ds):
-        if dataset_filter and row.get("dataset") != dataset_filter:
+        # Filter by context length (prefer text without labels for cleaner eval)
+        context_length = len(row.get("context_window_text", ""))
+        if context_length < min_context_length:
             continue
 
-        context = row.get("context_window_text", "")
-        if len(context) < min_context_length:
-            continue
+        row["id"] = f"{row.get('id', idx)}"
+        row["context_length"] = context_length
+        yield row
+
+
+def _cache_path(cache_dir: Path, dataset_filter: str, split: str, min_context_length: int) -> Path:
+    """Get the cache file for a set of dataset filters."""
+    key = f"{CACHE_VERSION}|{dataset_filter}|{split}|{min_context_length}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:12]
+    return cache_dir / f"oolong_{digest}.arrow"
 
-        yield Task(
-            id=f"{row.get('id', idx)}",
-            dataset=row.get("dataset", "unknown"),
-            context=context,
-            question=row.get("question", ""),
-            expected_answer=str(row.get("answer", "")).strip("[]"),
-            answer_type=map_answer_type(row.get("answer_type", "LABEL")),
-            context_length=len(context),
-            task_type=row.get("task", ""),
-            metadata={
-                "task_group": row.get("task_group", ""),
-                "num_labels": row.get("num_labels", 0),
-                "context_window_id": row.get("context_window_id", 0),
-                "input_subset": row.get("input_subset", ""),
-            },
-        )
+
+def _iter_cached_rows(cache_path: Path) -> Iterator[dict]:
+    """Read cached rows back in batches from a memory map of the cache.
+
+    The file is uncompressed, so batches reference the mapped pages directly
+    and only the rows being converted are copied onto the Python heap.
+    """
+    with pa.memory_map(str(cache_path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield from reader.get_batch(i).to_pylist()
+
+
+def _cached_contexts_exist(cache_path: Path, context_dir: Path) -> bool:
+    """Check that every cached task still has its context file."""
+    with pa.memory_map(str(cache_path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            for task_id in reader.get_batch(i).column("id").to_pylist():
+                if not context_file(task_id, context_dir).exists():
+                    return False
+    return True
+
+
+def _cache_rows(rows: Iterator[dict], cache_path: Path) -> Iterator[dict]:
+    """Pass rows through while writing them to an Arrow IPC cache file.
+
+    The context text is left out of the cache; the row is consumed (and its
+    context written) before it is cached. The cache is only kept once every
+    row has been consumed, so a partial iteration (e.g. a limit) never
+    leaves a truncated cache behind.
+    """
+    tmp_path = cache_path.with_suffix(".tmp")
+    writer: pa.ipc.RecordBatchFileWriter | None = None
+    schema: pa.Schema | None = None
+    pending: list[dict] = []
+    caching = True
+    complete = False
+
+    def flush() -> bool:
+        nonlocal writer, schema
+        if not pending:
+            return True
+        try:
+            batch = pa.RecordBatch.from_pylist(pending, schema=schema)
+            if writer is None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                schema = batch.schema
+                writer = pa.ipc.new_file(str(tmp_path), schema)
+            writer.write_batch(batch)
+        except (pa.ArrowException, OSError):
+            # Row types the first batch did not anticipate; skip caching
+            return False
+        pending.clear()
+        return True
+
+    try:
+        for row in rows:
+            yield row
+            if caching:
+                pending.append({k: v for k, v in row.items() if k != "context_window_text"})
+                if len(pending) >= CACHE_BATCH_SIZE:
+                    caching = flush()
+        complete = caching and flush()
+    finally:
+        if writer is not None:
+            writer.close()
+            if complete:
+                tmp_path.replace(cache_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+
+
+def _count_values(counts: dict[str, int], batch: pa.Table, column: str) -> None:
+    """Add per-value row counts of an Arrow column to counts."""
+    if column not in batch.column_names:
+        if batch.num_rows:
+            counts["unknown"] = counts.get("unknown", 0) + batch.num_rows
+        return
+
+    for item in pc.value_counts(batch.column(column)).to_pylist():
+        value = item["values"] if item["values"] is not None else "unknown"
+        counts[value] = counts.get(value, 0) + item["counts"]
 
 
 def get_dataset_stats(
@@ -126,40 +306,57 @@ def get_dataset_stats(
 ) -> dict:
     """Get statistics about the filtered dataset.
 
+    The split is streamed in Arrow batches, so nothing is downloaded or
+    materialized beyond the batch being counted.
+
     Returns:
         Dictionary with task counts, context length distribution, etc.
     """
-    ds = load_dataset("oolongbench/oolong-synth", split=split)
+    # Work on streamed Arrow batches so context lengths are computed without
+    # decoding any context into a Python string
+    ds = load_dataset(DATASET_NAME, split=split, streaming=True)
+    ds = _select_columns(ds, STATS_COLUMNS).with_format("arrow")
 
+    # Context length stats are reduced per batch into running scalars
     total = 0
     filtered = 0
-    context_lengths = []
+    length_sum = 0
+    length_min = 0
+    length_max = 0
     task_types: dict[str, int] = {}
     answer_types: dict[str, int] = {}
 
-    for row in ds:
-        total += 1
-        if dataset_filter and row.get("dataset") != dataset_filter:
+    for batch in ds.iter(batch_size=STATS_BATCH_SIZE):
+        total += batch.num_rows
+        if dataset_filter:
+            batch = batch.filter(pc.equal(batch.column("dataset"), dataset_filter))
+        if not batch.num_rows:
             continue
-        filtered += 1
 
-        ctx_len = len(row.get("context_window_text", ""))
-        context_lengths.append(ctx_len)
+        if "context_window_text" in batch.column_names:
+            lengths = pc.utf8_length(batch.column("context_window_text")).fill_null(0)
+            batch_min_max = pc.min_max(lengths)
+            batch_min = batch_min_max["min"].as_py()
+            batch_max = batch_min_max["max"].as_py()
+            length_sum += pc.sum(lengths).as_py()
+        else:
+            batch_min = batch_max = 0
 
-        task_type = row.get("task", "unknown")
-        task_types[task_type] = task_types.get(task_type, 0) + 1
+        length_min = batch_min if not filtered else min(length_min, batch_min)
+        length_max = max(length_max, batch_max)
+        filtered += batch.num_rows
 
-        ans_type = row.get("answer_type", "unknown")
-        answer_types[ans_type] = answer_types.get(ans_type, 0) + 1
+        _count_values(task_types, batch, "task")
+        _count_values(answer_types, batch, "answer_type")
 
     return {
         "total_in_split": total,
         "filtered_count": filtered,
         "dataset_filter": dataset_filter,
         "context_length": {
-            "min": min(context_lengths) if context_lengths else 0,
-            "max": max(context_lengths) if context_lengths else 0,
-            "avg": sum(context_lengths) / len(context_lengths) if context_lengths else 0,
+            "min": length_min,
+            "max": length_max,
+            "avg": length_sum / filtered if filtered else 0,
         },
         "task_types": task_types,
         "answer_types": answer_types,
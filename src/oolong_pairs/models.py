@@ -1,7 +1,9 @@
 """Data models for OOLONG-Pairs benchmark."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -30,23 +32,29 @@ class ExecutionMode(str, Enum):
     HOOKS = "hooks"
 
 
-class Task(BaseModel):
-    """A single OOLONG benchmark task."""
+@dataclass(slots=True)
+class Task:
+    """A single OOLONG benchmark task.
+
+    Tasks are built once per dataset row from trusted data, so this is a
+    slotted dataclass rather than a validated pydantic model. The context is
+    kept on disk and only read when a strategy needs it.
+    """
 
     id: str
     dataset: str  # e.g., 'trec_coarse'
-    context: str  # The long context window text
+    context_path: Path  # File holding the long context window text
     question: str
     expected_answer: str
     answer_type: AnswerType
-    context_length: int = Field(default=0)
+    context_length: int = 0  # In characters, supplied by the loader
     task_type: str = ""  # e.g., 'MOST_FREQ', 'NUMERIC_ONE_CLASS'
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
-    def model_post_init(self, _context: Any) -> None:
-        """Calculate context length after initialization."""
-        if self.context_length == 0:
-            self.context_length = len(self.context)
+    @property
+    def context(self) -> str:
+        """The long context window text, read from disk."""
+        return self.context_path.read_text(encoding="utf-8")
 
 
 class Result(BaseModel):
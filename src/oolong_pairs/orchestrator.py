@@ -7,16 +7,55 @@ This module drives the benchmark by:
 4. Collecting results
 """
 
-import json
+import contextlib
 import os
 import subprocess
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from .claude import ClaudeSession
 from .dataset import load_oolong_tasks
-from .models import BenchmarkRun, ExecutionMode, Strategy
+from .models import BenchmarkRun, ExecutionMode, Strategy, Task
+from .state import DEFAULT_STATE_DIR, STATE_FILENAME, get_state_file, read_state, write_state
 from .storage import Storage
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    Observer = None
+else:
+
+    class _StateFileHandler(FileSystemEventHandler):
+        """Wake the waiter of a task whenever its state file is written or replaced."""
+
+        def __init__(self):
+            self._waiters: dict[str, threading.Event] = {}
+            self._lock = threading.Lock()
+
+        def watch(self, state_dir: Path) -> threading.Event:
+            """Return an event that is set when the state file in `state_dir` changes."""
+            changed = threading.Event()
+            with self._lock:
+                self._waiters[str(state_dir)] = changed
+            return changed
+
+        def unwatch(self, state_dir: Path) -> None:
+            with self._lock:
+                self._waiters.pop(str(state_dir), None)
+
+        def on_any_event(self, event) -> None:
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if os.path.basename(path) != STATE_FILENAME:
+                    continue
+                with self._lock:
+                    changed = self._waiters.get(os.path.dirname(path))
+                if changed is not None:
+                    changed.set()
+
 
 class HooksOrchestrator:
     """Orchestrate benchmark execution using Claude Code hooks."""
@@ -27,28 +66,53 @@ class HooksOrchestrator:
         db_path: Path,
         state_dir: Path | None = None,
         model: str = "claude-sonnet-4-20250514",
+        parallelism: int = 1,
     ):
         self.strategy = strategy
-        self.storage = Storage(db_path)
-        self.state_dir = state_dir or Path("/tmp/oolong-pairs")
+        self.db_path = Path(db_path)
+        self.state_dir = state_dir or DEFAULT_STATE_DIR
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.model = model
+        self.parallelism = parallelism
+
+        self._env = os.environ.copy()
+        self._env["OOLONG_STATE_DIR"] = str(self.state_dir)
+        self._env["OOLONG_DB_PATH"] = str(self.db_path)
+        self._session = ClaudeSession(model, "json", timeout=600, env=self._env)
+        self._state_handler = None
+
+    def _task_state_dir(self, run_id: str, index: int) -> Path:
+        """Get the state directory of one task.
+
+        Every task gets its own directory so concurrent sessions never share
+        a state file; the hooks find it through OOLONG_STATE_DIR.
+        """
+        state_dir = self.state_dir / run_id / str(index)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        return state_dir
 
     def _write_task_state(
         self,
+        state_dir: Path,
         task_id: str,
         run_id: str,
-        context: str,
+        context_path: Path,
         question: str,
         expected_answer: str,
         answer_type: str,
     ) -> Path:
-        """Write task state file for hooks to read."""
-        state_file = self.state_dir / "current_task.json"
+        """Write task state file for hooks to read.
+
+        Only the path and byte length of the context file are stored, so the
+        state file stays small for the repeated reads and rewrites done by the
+        hooks, which map the file themselves.
+        """
+        state_file = get_state_file(state_dir)
         state = {
             "task_id": task_id,
             "run_id": run_id,
-            "context": context,
+            "context_path": str(context_path.resolve()),
+            "context_len": context_path.stat().st_size,
             "question": question,
             "expected_answer": expected_answer,
             "answer_type": answer_type,
@@ -56,58 +120,109 @@ class HooksOrchestrator:
             "status": "pending",
             "start_time": time.time(),
         }
-        with open(state_file, "w") as f:
-            json.dump(state, f)
+        write_state(state_file, state)
         return state_file
 
-    def _clear_task_state(self) -> None:
-        """Clear the task state file."""
-        state_file = self.state_dir / "current_task.json"
+    def _clear_task_state(self, state_dir: Path) -> None:
+        """Clear the task state file and its directory."""
+        state_file = get_state_file(state_dir)
         if state_file.exists():
             state_file.unlink()
+        with contextlib.suppress(OSError):
+            state_dir.rmdir()
 
-    def _launch_session(self, prompt: str) -> subprocess.CompletedProcess:
-        """Launch a Claude session with the benchmark prompt."""
-        env = os.environ.copy()
-        env["OOLONG_STATE_DIR"] = str(self.state_dir)
-        env["OOLONG_DB_PATH"] = str(self.storage.db_path)
-
-        result = subprocess.run(
-            [
-                "claude",
-                "--print",
-                "--model",
-                self.model,
-                "--output-format",
-                "json",
-            ],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=600,
-            env=env,
-        )
-        return result
+    def _launch_session(self, prompt: bytes, state_dir: Path) -> subprocess.CompletedProcess:
+        """Launch a Claude session whose hooks use the given state directory."""
+        env = {**self._env, "OOLONG_STATE_DIR": str(state_dir)}
+        return self._session.run(prompt, env=env)
 
-    def _wait_for_completion(self, timeout: float = 60.0) -> dict | None:
-        """Wait for task to complete and return result."""
-        state_file = self.state_dir / "current_task.json"
-        start = time.time()
+    @contextlib.contextmanager
+    def _watch_state_files(self, run_dir: Path) -> Iterator[None]:
+        """Watch the state files of every task under `run_dir`.
+
+        With watchdog installed, one observer thread (and one inotify
+        descriptor) serves the whole run instead of one per task.
+        """
+        if Observer is None:
+            yield
+            return
 
-        while time.time() - start < timeout:
-            if not state_file.exists():
-                return None
+        handler = _StateFileHandler()
+        observer = Observer()
+        observer.schedule(handler, str(run_dir), recursive=True)
+        observer.start()
+        self._state_handler = handler
+        try:
+            yield
+        finally:
+            self._state_handler = None
+            observer.stop()
+            observer.join()
 
-            with open(state_file) as f:
-                state = json.load(f)
+    def _wait_for_completion(self, state_dir: Path, timeout: float = 60.0) -> dict | None:
+        """Wait for task to complete and return result.
 
-            if state.get("status") == "completed":
-                return state
+        Inside `_watch_state_files` the state file is re-read when it changes;
+        otherwise, or if no change is reported for a while, it is polled.
+        """
+        state_file = get_state_file(state_dir)
+        handler = self._state_handler
+        if handler is not None:
+            changed = handler.watch(state_dir)
+            poll_interval = 2.0
+        else:
+            changed = threading.Event()
+            poll_interval = 0.5
 
-            time.sleep(0.5)
+        start = time.time()
+        try:
+            while (remaining := timeout - (time.time() - start)) > 0:
+                changed.clear()
+                if not state_file.exists():
+                    return None
+
+                state = read_state(state_file)
+                if state and state.get("status") == "completed":
+                    return state
+
+                changed.wait(min(poll_interval, remaining))
+        finally:
+            if handler is not None:
+                handler.unwatch(state_dir)
 
         return None
 
+    def _run_task(self, task: Task, run_id: str, index: int) -> dict | None:
+        """Run one task through a hooks session and return its final state."""
+        state_dir = self._task_state_dir(run_id, index)
+
+        # Write task state
+        self._write_task_state(
+            state_dir,
+            task_id=task.id,
+            run_id=run_id,
+            context_path=task.context_path,
+            question=task.question,
+            expected_answer=task.expected_answer,
+            answer_type=task.answer_type.value,
+        )
+
+        # Launch session - the hooks will handle injection and scoring
+        # For hooks mode, we just trigger the session; hooks do the rest
+        prompt = b"Begin benchmark task."
+        try:
+            self._launch_session(prompt, state_dir)
+        except subprocess.TimeoutExpired:
+            print(f"    Timeout for task {task.id}")
+        except Exception as e:
+            print(f"    Error for task {task.id}: {e}")
+
+        # Wait for completion
+        try:
+            return self._wait_for_completion(state_dir)
+        finally:
+            self._clear_task_state(state_dir)
+
     def run_benchmark(
         self,
         dataset_filter: str = "trec_coarse",
@@ -116,6 +231,21 @@ class HooksOrchestrator:
         limit: int | None = None,
     ) -> str:
         """Run the benchmark and return the run ID."""
+        storage = Storage(self.db_path)
+        try:
+            return self._run_benchmark(storage, dataset_filter, split, min_context_length, limit)
+        finally:
+            storage.close()
+
+    def _run_benchmark(
+        self,
+        storage: Storage,
+        dataset_filter: str,
+        split: str,
+        min_context_length: int,
+        limit: int | None,
+    ) -> str:
+        """Run the benchmark, recording the run in the given storage."""
         import uuid
         from datetime import datetime
 
@@ -127,7 +257,7 @@ class HooksOrchestrator:
             mode=ExecutionMode.HOOKS,
             strategy=self.strategy,
         )
-        self.storage.save_run(run)
+        storage.save_run(run)
 
         # Load tasks
         tasks = load_oolong_tasks(
@@ -139,40 +269,41 @@ class HooksOrchestrator:
 
         print(f"Running benchmark {run_id} with {len(tasks)} tasks")
 
-        for i, task in enumerate(tasks):
-            print(f"  Task {i + 1}/{len(tasks)}: {task.id[:16]}...")
-
-            # Write task state
-            self._write_task_state(
-                task_id=task.id,
-                run_id=run_id,
-                context=task.context,
-                question=task.question,
-                expected_answer=task.expected_answer,
-                answer_type=task.answer_type.value,
-            )
-
-            # Launch session - the hooks will handle injection and scoring
-            # For hooks mode, we just trigger the session; hooks do the rest
-            prompt = "Begin benchmark task."
-            try:
-                self._launch_session(prompt)
-            except subprocess.TimeoutExpired:
-                print(f"    Timeout for task {task.id}")
-            except Exception as e:
-                print(f"    Error for task {task.id}: {e}")
-
-            # Wait for completion
-            result = self._wait_for_completion()
-            if result:
-                score = result.get("score", 0.0)
-                print(f"    Score: {score:.4f}")
-            else:
-                print("    No result captured")
-
-            self._clear_task_state()
+        # Tasks are independent and each one mostly waits on its session,
+        # so up to `parallelism` of them run at once
+        run_dir = self.state_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        with self._watch_state_files(run_dir):
+            self._run_tasks(tasks, run_id)
+
+        with contextlib.suppress(OSError):
+            run_dir.rmdir()
 
         # Update run stats
-        self.storage.update_run_stats(run_id)
+        storage.update_run_stats(run_id)
 
         return run_id
+
+    def _run_tasks(self, tasks: list[Task], run_id: str) -> None:
+        """Run tasks up to `parallelism` at a time, reporting each as it finishes."""
+        pool = ThreadPoolExecutor(max_workers=self.parallelism)
+        futures = {
+            pool.submit(self._run_task, task, run_id, i): task for i, task in enumerate(tasks)
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                task = futures[future]
+                print(f"  Task {done}/{len(tasks)}: {task.id[:16]}...")
+                result = future.result()
+                if result:
+                    score = result.get("score", 0.0)
+                    print(f"    Score: {score:.4f}")
+                else:
+                    print("    No result captured")
+        except BaseException:
+            # On Ctrl-C (or any error) start no new sessions; the running
+            # ones finish and clean up their state directories
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            pool.shutdown()
@@ -1,37 +1,106 @@
 """Scoring logic for OOLONG benchmark answers."""
 
+import math
 import re
-from typing import Callable
+import sys
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from .models import AnswerType
 
-
+if TYPE_CHECKING:
+    # NumPy is only imported by the batch scorer; the hooks score one answer
+    # per process and should not pay for it
+    import numpy as np
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# 0.75^e == exp(e * log(0.75)); NumPy's exp is several times faster than its
+# generic power on arrays
+_LOG_DECAY = math.log(0.75)
+
+# Comparison buckets, in priority order for answers that mention several
+_MORE, _LESS, _SAME = 0, 1, 2
+
+# Words that place a comparison answer in a bucket, in priority order;
+# multi-word variants such as "more common" or "same frequency" are matched
+# by their first word. Scanning three small sets in order beats looking up
+# every word of the answer in one dict.
+_COMPARISON_BUCKETS = (
+    (frozenset({"more", "greater", "higher", "larger"}), _MORE),
+    (frozenset({"less", "smaller", "lower", "fewer"}), _LESS),
+    (frozenset({"same", "equal", "tied"}), _SAME),
+)
+_COMPARISON_WORDS = frozenset({"more", "less", "same", "common", "greater", "fewer"})
+
+# ASCII characters a plain, comma- or underscore-grouped number is written
+# with; float() also accepts non-ASCII digits, which skip this probe
+_DIGITS = frozenset("0123456789")
+_NUMERIC_CHARS = _DIGITS | frozenset(",._-+ \t\n")
+
+# Answer type strings by their part before any "_" suffix
+_ANSWER_TYPE_PREFIXES = {
+    "NUMERIC": AnswerType.NUMERIC,
+    "LABEL": AnswerType.LABEL,
+    "COMPARISON": AnswerType.COMPARISON,
+    "DATE": AnswerType.DATE,
+}
+
+# Small integer codes for answer types, so batch partitions compare int8
+# arrays instead of object arrays of strings; callers may pass these codes
+# to score_answers_batch directly, with -1 for "detect"
+ANSWER_TYPE_CODES = {answer_type: code for code, answer_type in enumerate(AnswerType)}
+_DETECT_CODE = -1
+
+# Normalized answers up to this length are interned: labels repeat across a
+# dataset, and equal interned strings compare by identity
+_INTERN_MAX_LEN = 32
+
+
+@lru_cache(maxsize=4096)
 def normalize_answer(answer: str) -> str:
     """Normalize answer for comparison."""
-    # Strip whitespace and lowercase
-    normalized = answer.strip().lower()
-    # Remove common formatting artifacts
-    normalized = re.sub(r"[*_`]", "", normalized)
+    # Strip whitespace and casefold (lower() that also folds e.g. "ß" to "ss")
+    normalized = answer.strip().casefold()
+    # Remove common formatting artifacts; str.replace returns the string
+    # itself when there is nothing to remove, so clean answers cost no copies
+    normalized = normalized.replace("*", "").replace("_", "").replace("`", "")
     # Remove leading/trailing quotes
     normalized = normalized.strip("\"'")
+    if len(normalized) <= _INTERN_MAX_LEN:
+        normalized = sys.intern(normalized)
     return normalized
 
 
+def _words(answer: str) -> set[str]:
+    """Split an answer into its lower-case alphabetic words.
+
+    This runs on the raw answer rather than the normalized one, since
+    normalization deletes "_" and would join "more_common" into one word.
+    """
+    return set(_WORD_RE.findall(answer.casefold()))
+
+
 def is_numeric(answer: str) -> bool:
     """Check if answer is numeric."""
-    try:
-        float(answer.replace(",", ""))
-        return True
-    except ValueError:
-        return False
+    return parse_numeric(answer) is not None
 
 
 def parse_numeric(answer: str) -> float | None:
     """Parse numeric answer, handling commas."""
+    # Plain numbers are the common case; float() validates them (and strips
+    # whitespace) itself, so the comma-free copy is only made when needed
     try:
-        return float(answer.replace(",", "").strip())
+        return float(answer)
     except ValueError:
-        return None
+        pass
+    if "," in answer:
+        try:
+            return float(answer.replace(",", ""))
+        except ValueError:
+            pass
+    return None
 
 
 def numeric_score(expected: float, actual: float) -> float:
@@ -42,30 +111,26 @@ def numeric_score(expected: float, actual: float) -> float:
 
 def label_score(expected: str, actual: str) -> float:
     """Score label answer using exact match (case-insensitive)."""
+    # Identical raw answers match without normalizing either
+    if expected == actual:
+        return 1.0
     return 1.0 if normalize_answer(expected) == normalize_answer(actual) else 0.0
 
 
+@lru_cache(maxsize=4096)
+def _comparison_bucket(answer: str) -> int | None:
+    """Get the comparison bucket of an answer, if it has one."""
+    words = _words(answer)
+    for synonyms, bucket in _COMPARISON_BUCKETS:
+        if not synonyms.isdisjoint(words):
+            return bucket
+    return None
+
+
 def comparison_score(expected: str, actual: str) -> float:
     """Score comparison answers (more/less/same)."""
-    expected_norm = normalize_answer(expected)
-    actual_norm = normalize_answer(actual)
-
-    # Map common variations
-    more_variants = {"more", "more common", "greater", "higher", "larger"}
-    less_variants = {"less", "less common", "smaller", "lower", "fewer"}
-    same_variants = {"same", "equal", "same frequency", "tied"}
-
-    def categorize(text: str) -> str | None:
-        if any(v in text for v in more_variants):
-            return "more"
-        if any(v in text for v in less_variants):
-            return "less"
-        if any(v in text for v in same_variants):
-            return "same"
-        return None
-
-    expected_cat = categorize(expected_norm)
-    actual_cat = categorize(actual_norm)
+    expected_cat = _comparison_bucket(expected)
+    actual_cat = _comparison_bucket(actual)
 
     if expected_cat is None or actual_cat is None:
         # Fall back to exact match if we can't categorize
@@ -74,29 +139,28 @@ def comparison_score(expected: str, actual: str) -> float:
     return 1.0 if expected_cat == actual_cat else 0.0
 
 
+@lru_cache(maxsize=64)
 def map_answer_type_str(answer_type_str: str) -> AnswerType:
-    """Map string to AnswerType enum."""
-    mapping = {
-        "NUMERIC": AnswerType.NUMERIC,
-        "NUMERIC_ONE_CLASS": AnswerType.NUMERIC,
-        "LABEL": AnswerType.LABEL,
-        "COMPARISON": AnswerType.COMPARISON,
-        "DATE": AnswerType.DATE,
-    }
-    return mapping.get(answer_type_str.upper(), AnswerType.LABEL)
+    """Map string to AnswerType enum.
+
+    Variants such as "NUMERIC_ONE_CLASS" map by their prefix.
+    """
+    prefix = answer_type_str.upper().split("_", 1)[0]
+    return _ANSWER_TYPE_PREFIXES.get(prefix, AnswerType.LABEL)
 
 
+@lru_cache(maxsize=4096)
 def detect_answer_type(expected: str) -> AnswerType:
     """Detect answer type from expected answer."""
-    normalized = normalize_answer(expected)
-
     # Check for comparison words
-    comparison_words = {"more", "less", "same", "common", "greater", "fewer"}
-    if any(word in normalized for word in comparison_words):
+    if not _COMPARISON_WORDS.isdisjoint(_words(expected)):
         return AnswerType.COMPARISON
 
-    # Check for numeric
-    if is_numeric(expected):
+    # Check for numeric; the character-set probe turns ASCII labels away
+    # without raising and catching a ValueError in float()
+    chars = frozenset(expected)
+    probe = not expected.isascii() or (chars <= _NUMERIC_CHARS and not chars.isdisjoint(_DIGITS))
+    if probe and is_numeric(expected):
         return AnswerType.NUMERIC
 
     # Default to label
@@ -105,17 +169,17 @@ def detect_answer_type(expected: str) -> AnswerType:
 
 def get_scorer(answer_type: AnswerType) -> Callable[[str, str], float]:
     """Get scoring function for answer type."""
-    scorers: dict[AnswerType, Callable[[str, str], float]] = {
-        AnswerType.NUMERIC: _score_numeric,
-        AnswerType.LABEL: label_score,
-        AnswerType.COMPARISON: comparison_score,
-        AnswerType.DATE: label_score,  # Exact match for dates
-    }
-    return scorers.get(answer_type, label_score)
+    return _SCORERS.get(answer_type, label_score)
 
 
 def _score_numeric(expected: str, actual: str) -> float:
     """Wrapper for numeric scoring with parsing."""
+    # Plain numbers on both sides skip the comma handling and fallbacks
+    try:
+        return numeric_score(float(expected), float(actual))
+    except ValueError:
+        pass
+
     exp_val = parse_numeric(expected)
     act_val = parse_numeric(actual)
 
@@ -126,9 +190,22 @@ def _score_numeric(expected: str, actual: str) -> float:
     return numeric_score(exp_val, act_val)
 
 
+# Built once at import; score_answer dispatches with a single lookup
+_SCORERS: dict[AnswerType, Callable[[str, str], float]] = {
+    AnswerType.NUMERIC: _score_numeric,
+    AnswerType.LABEL: label_score,
+    AnswerType.COMPARISON: comparison_score,
+    AnswerType.DATE: label_score,  # Exact match for dates
+}
+
+
+@lru_cache(maxsize=50_000)
 def score_answer(expected: str, actual: str, answer_type: AnswerType | None = None) -> float:
     """Score an answer against expected.
 
+    Scores are cached, so re-scoring a repeated (expected, actual, type)
+    triple is a single lookup.
+
     Args:
         expected: The expected/gold answer
         actual: The actual/predicted answer
@@ -137,11 +214,136 @@ def score_answer(expected: str, actual: str, answer_type: AnswerType | None = No
     Returns:
         Score between 0.0 and 1.0
     """
-    if not actual or not actual.strip():
+    # Blank answers, including ones that are only formatting, score zero;
+    # the normalized answer is cached for the scorer below
+    if not normalize_answer(actual):
         return 0.0
 
     if answer_type is None:
         answer_type = detect_answer_type(expected)
 
-    scorer = get_scorer(answer_type)
-    return scorer(expected, actual)
+    return _SCORERS.get(answer_type, label_score)(expected, actual)
+
+
+def score_answers_batch(
+    expected: Sequence[str],
+    actual: Sequence[str],
+    types: "Sequence[AnswerType | None] | np.ndarray | None" = None,
+) -> "np.ndarray":
+    """Score many answers at once.
+
+    Answers are passed as parallel columns (lists, NumPy string arrays or
+    any other sequence) rather than as rows. `types` is either a sequence
+    of AnswerType (None to detect) or an integer array of ANSWER_TYPE_CODES
+    (-1 to detect), e.g. an int8 column. Without `types`, every answer type
+    is detected from the expected answer.
+
+    Pairs are partitioned by answer type and each partition is scored with
+    array operations: numeric pairs with one vectorized exp(|error| *
+    log(0.75)), equal to `numeric_score` up to float rounding, comparison
+    pairs by comparing bucket ids, and the rest by comparing normalized
+    answers. Pairs a type cannot handle fall back to the label comparison,
+    as in `score_answer`.
+
+    Returns:
+        Array of scores between 0.0 and 1.0, in input order
+    """
+    import numpy as np
+
+    if types is None:
+        kinds = np.full(len(expected), _DETECT_CODE, dtype=np.int8)
+    elif isinstance(types, np.ndarray) and types.dtype.kind in "iu":
+        if types.size and (types.min() < _DETECT_CODE or types.max() >= len(ANSWER_TYPE_CODES)):
+            raise ValueError("types contains an unknown answer type code")
+        kinds = types.astype(np.int8)
+    else:
+        kinds = np.fromiter(
+            (
+                _DETECT_CODE if answer_type is None else ANSWER_TYPE_CODES[answer_type]
+                for answer_type in types
+            ),
+            dtype=np.int8,
+            count=len(types),
+        )
+    if not len(expected) == len(actual) == len(kinds):
+        raise ValueError("expected, actual and types must have the same length")
+
+    undetected = np.flatnonzero(kinds == _DETECT_CODE).tolist()
+    kinds[undetected] = [ANSWER_TYPE_CODES[detect_answer_type(expected[i])] for i in undetected]
+
+    # Label comparison of normalized answers; also the fallback for numeric
+    # and comparison pairs that do not parse or categorize
+    expected_norm = [normalize_answer(exp) for exp in expected]
+    actual_norm = [normalize_answer(act) for act in actual]
+    answered = np.array([bool(act) for act in actual_norm], dtype=bool)
+    scores = np.array(
+        [exp == act for exp, act in zip(expected_norm, actual_norm, strict=True)],
+        dtype=np.float64,
+    )
+
+    numeric_idx = np.flatnonzero(answered & (kinds == ANSWER_TYPE_CODES[AnswerType.NUMERIC]))
+    if numeric_idx.size:
+        exp_parsed = [parse_numeric(expected[i]) for i in numeric_idx.tolist()]
+        act_parsed = [parse_numeric(actual[i]) for i in numeric_idx.tolist()]
+        # Parse failures are tracked apart from the values, which may
+        # themselves be NaN ("nan" parses) and must score as in numeric_score
+        parsed = np.array(
+            [
+                exp is not None and act is not None
+                for exp, act in zip(exp_parsed, act_parsed, strict=True)
+            ],
+            dtype=bool,
+        )
+        exp_vals = np.array([0.0 if v is None else v for v in exp_parsed])
+        act_vals = np.array([0.0 if v is None else v for v in act_parsed])
+        scores[numeric_idx[parsed]] = _numeric_kernel()(exp_vals[parsed], act_vals[parsed])
+
+    comparison_idx = np.flatnonzero(answered & (kinds == ANSWER_TYPE_CODES[AnswerType.COMPARISON]))
+    if comparison_idx.size:
+        exp_buckets = np.array([_bucket_id(expected[i]) for i in comparison_idx.tolist()])
+        act_buckets = np.array([_bucket_id(actual[i]) for i in comparison_idx.tolist()])
+        categorized = (exp_buckets >= 0) & (act_buckets >= 0)
+        scores[comparison_idx[categorized]] = exp_buckets[categorized] == act_buckets[categorized]
+
+    scores[~answered] = 0.0
+    return scores
+
+
+def _numeric_scores(expected: "np.ndarray", actual: "np.ndarray") -> "np.ndarray":
+    """Vectorized `numeric_score` over float arrays."""
+    import numpy as np
+
+    return np.exp(np.abs(expected - actual) * _LOG_DECAY)
+
+
+@lru_cache(maxsize=1)
+def _numeric_kernel() -> Callable[["np.ndarray", "np.ndarray"], "np.ndarray"]:
+    """Get the numeric batch kernel, JIT-compiled with numba when installed.
+
+    numba is imported and the kernel compiled on the first batch rather than
+    at import, so the hooks, which score one answer each, never pay for it;
+    cache=True keeps the compiled code on disk for later processes.
+    """
+    import numpy as np
+
+    try:
+        from numba import njit, prange
+    except ImportError:  # pragma: no cover - optional dependency
+        return _numeric_scores
+
+    log_decay = _LOG_DECAY
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def numeric_scores(expected, actual):  # pragma: no cover - compiled
+        out = np.empty_like(expected)
+        for i in prange(expected.shape[0]):
+            out[i] = math.exp(log_decay * abs(expected[i] - actual[i]))
+        return out
+
+    return numeric_scores
+
+
+def _bucket_id(answer: str) -> int:
+    """Get the comparison bucket of an answer, with -1 for none."""
+    bucket = _comparison_bucket(answer)
+    return -1 if bucket is None else bucket
@@ -0,0 +1,27 @@
+"""JSON encoding shared by the state file, storage and CLI output parsing.
+
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+Both raise a ValueError subclass on malformed input.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,47 @@
+"""Task state file shared between the orchestrator and the hooks.
+
+The orchestrator writes one state file per queued task; the SessionStart and
+Stop hooks read and update it.
+"""
+
+import os
+from pathlib import Path
+
+from .serialization import dumps, loads
+
+DEFAULT_STATE_DIR = Path("/tmp/oolong-pairs")
+STATE_FILENAME = "current_task.json"
+
+
+def get_state_dir() -> Path:
+    """Get the benchmark state directory from environment."""
+    return Path(os.environ.get("OOLONG_STATE_DIR", str(DEFAULT_STATE_DIR)))
+
+
+def get_state_file(state_dir: Path | None = None) -> Path:
+    """Get the benchmark state file path."""
+    return (state_dir or get_state_dir()) / STATE_FILENAME
+
+
+def read_state(state_file: Path) -> dict | None:
+    """Read task state, returning None if the file is missing or unreadable."""
+    try:
+        data = state_file.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        return loads(data)
+    except ValueError:
+        return None
+
+
+def write_state(state_file: Path, state: dict) -> None:
+    """Write task state in a single encode and write.
+
+    The bytes go to a temporary file that is renamed over the state file, so
+    a reader polling it never sees a partially written document.
+    """
+    tmp = state_file.with_suffix(".tmp")
+    tmp.write_bytes(dumps(state))
+    tmp.replace(state_file)
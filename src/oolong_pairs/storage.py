@@ -1,9 +1,15 @@
 """SQLite storage for benchmark results."""
 
-import json
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+
+from pydantic_core import to_json
+
 from .models import BenchmarkRun, ExecutionMode, Result, RunSummary, Strategy
+from .serialization import dumps, loads
 
 DEFAULT_DB_PATH = Path("data/benchmark.db")
 
@@ -37,6 +43,16 @@ CREATE TABLE IF NOT EXISTS results (
 
 CREATE INDEX IF NOT EXISTS idx_results_run_id ON results(run_id);
 CREATE INDEX IF NOT EXISTS idx_results_task_id ON results(task_id);
+CREATE INDEX IF NOT EXISTS idx_results_run_error ON results(run_id, error);
+"""
+
+# Kept as one constant so every insert reuses the connection's cached
+# prepared statement
+INSERT_RESULT_SQL = """
+INSERT INTO results
+(run_id, task_id, strategy, actual_answer, expected_answer,
+ score, latency_ms, tokens_used, error)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
 
@@ -46,22 +62,52 @@ class Storage:
     def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
+        self._write_lock = threading.Lock()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by all queries on this storage."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL lets the hooks write results while the CLI holds a connection,
+        # and NORMAL sync avoids an fsync on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn as conn:
             conn.executescript(SCHEMA)
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection for reads.
+
+        Reads do not enter the connection context, which would commit a
+        transaction another thread has in progress.
+        """
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction on the shared connection.
+
+        Writers from different threads are serialized so their statements
+        never interleave in one transaction; WAL readers are not blocked.
+        """
+        with self._write_lock, self._conn as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
 
     def save_run(self, run: BenchmarkRun) -> None:
         """Insert or update a benchmark run."""
-        with self._get_conn() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO runs
@@ -79,158 +125,183 @@ class Storage:
                     run.tasks_failed,
                     run.avg_score,
                     run.total_latency_ms,
-                    json.dumps(run.metadata),
+                    dumps(run.metadata).decode(),
                 ),
             )
 
     def save_result(self, result: Result) -> None:
         """Insert a task result."""
-        with self._get_conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO results
-                (run_id, task_id, strategy, actual_answer, expected_answer,
-                 score, latency_ms, tokens_used, error)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    result.run_id,
-                    result.task_id,
-                    result.strategy.value,
-                    result.actual_answer,
-                    result.expected_answer,
-                    result.score,
-                    result.latency_ms,
-                    result.tokens_used,
-                    result.error,
-                ),
+        self.save_results([result])
+
+    def save_results(self, results: list[Result]) -> None:
+        """Insert task results in a single transaction."""
+        if not results:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                INSERT_RESULT_SQL,
+                [
+                    (
+                        result.run_id,
+                        result.task_id,
+                        result.strategy.value,
+                        result.actual_answer,
+                        result.expected_answer,
+                        result.score,
+                        result.latency_ms,
+                        result.tokens_used,
+                        result.error,
+                    )
+                    for result in results
+                ],
             )
 
     def get_run(self, run_id: str) -> BenchmarkRun | None:
         """Get a benchmark run by ID."""
-        with self._get_conn() as conn:
-            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
-            if not row:
-                return None
-            return BenchmarkRun(
-                id=row["id"],
-                timestamp=row["timestamp"],
-                mode=ExecutionMode(row["mode"]),
-                strategy=Strategy(row["strategy"]),
-                tasks_total=row["tasks_total"],
-                tasks_completed=row["tasks_completed"],
-                tasks_failed=row["tasks_failed"],
-                avg_score=row["avg_score"],
-                total_latency_ms=row["total_latency_ms"],
-                metadata=json.loads(row["metadata"]),
-            )
+        conn = self._get_conn()
+        row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if not row:
+            return None
+        return BenchmarkRun(
+            id=row["id"],
+            timestamp=row["timestamp"],
+            mode=ExecutionMode(row["mode"]),
+            strategy=Strategy(row["strategy"]),
+            tasks_total=row["tasks_total"],
+            tasks_completed=row["tasks_completed"],
+            tasks_failed=row["tasks_failed"],
+            avg_score=row["avg_score"],
+            total_latency_ms=row["total_latency_ms"],
+            metadata=loads(row["metadata"]),
+        )
 
     def get_results(self, run_id: str) -> list[Result]:
         """Get all results for a run."""
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM results WHERE run_id = ? ORDER BY id", (run_id,)
-            ).fetchall()
-            return [
-                Result(
-                    task_id=row["task_id"],
-                    run_id=row["run_id"],
-                    strategy=Strategy(row["strategy"]),
-                    actual_answer=row["actual_answer"] or "",
-                    expected_answer=row["expected_answer"] or "",
-                    score=row["score"],
-                    latency_ms=row["latency_ms"],
-                    tokens_used=row["tokens_used"],
-                    error=row["error"],
-                )
-                for row in rows
-            ]
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT * FROM results WHERE run_id = ? ORDER BY id", (run_id,)
+        ).fetchall()
+        return [
+            Result(
+                task_id=row["task_id"],
+                run_id=row["run_id"],
+                strategy=Strategy(row["strategy"]),
+                actual_answer=row["actual_answer"] or "",
+                expected_answer=row["expected_answer"] or "",
+                score=row["score"],
+                latency_ms=row["latency_ms"],
+                tokens_used=row["tokens_used"],
+                error=row["error"],
+            )
+            for row in rows
+        ]
 
     def get_run_summary(self, run_id: str) -> RunSummary | None:
-        """Get summary statistics for a run."""
-        run = self.get_run(run_id)
-        if not run:
-            return None
+        """Get summary statistics for a run.
 
-        results = self.get_results(run_id)
-        if not results:
-            return RunSummary(
-                run_id=run_id,
-                strategy=run.strategy,
-                mode=run.mode,
-                tasks_completed=0,
-                tasks_failed=0,
-                avg_score=0.0,
-                min_score=0.0,
-                max_score=0.0,
-                total_latency_ms=0.0,
-                avg_latency_ms=0.0,
-            )
-
-        scores = [r.score for r in results if r.error is None]
-        failed = [r for r in results if r.error is not None]
+        The run and the aggregates over its results come back from one query.
+        """
+        conn = self._get_conn()
+        row = conn.execute(
+            """
+            SELECT runs.mode, runs.strategy, agg.*
+            FROM runs, (
+                SELECT
+                    SUM(CASE WHEN error IS NULL THEN 1 ELSE 0 END) as completed,
+                    SUM(CASE WHEN error IS NOT NULL THEN 1 ELSE 0 END) as failed,
+                    AVG(CASE WHEN error IS NULL THEN score ELSE NULL END) as avg_score,
+                    MIN(CASE WHEN error IS NULL THEN score ELSE NULL END) as min_score,
+                    MAX(CASE WHEN error IS NULL THEN score ELSE NULL END) as max_score,
+                    SUM(latency_ms) as total_latency,
+                    AVG(latency_ms) as avg_latency
+                FROM results WHERE run_id = ?
+            ) as agg
+            WHERE runs.id = ?
+            """,
+            (run_id, run_id),
+        ).fetchone()
+        if not row:
+            return None
 
         return RunSummary(
             run_id=run_id,
-            strategy=run.strategy,
-            mode=run.mode,
-            tasks_completed=len(scores),
-            tasks_failed=len(failed),
-            avg_score=sum(scores) / len(scores) if scores else 0.0,
-            min_score=min(scores) if scores else 0.0,
-            max_score=max(scores) if scores else 0.0,
-            total_latency_ms=sum(r.latency_ms for r in results),
-            avg_latency_ms=sum(r.latency_ms for r in results) / len(results),
+            strategy=Strategy(row["strategy"]),
+            mode=ExecutionMode(row["mode"]),
+            tasks_completed=row["completed"] or 0,
+            tasks_failed=row["failed"] or 0,
+            avg_score=row["avg_score"] or 0.0,
+            min_score=row["min_score"] or 0.0,
+            max_score=row["max_score"] or 0.0,
+            total_latency_ms=row["total_latency"] or 0.0,
+            avg_latency_ms=row["avg_latency"] or 0.0,
         )
 
     def list_runs(self, limit: int = 20) -> list[BenchmarkRun]:
         """List recent benchmark runs."""
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM runs ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ).fetchall()
-            return [
-                BenchmarkRun(
-                    id=row["id"],
-                    timestamp=row["timestamp"],
-                    mode=ExecutionMode(row["mode"]),
-                    strategy=Strategy(row["strategy"]),
-                    tasks_total=row["tasks_total"],
-                    tasks_completed=row["tasks_completed"],
-                    tasks_failed=row["tasks_failed"],
-                    avg_score=row["avg_score"],
-                    total_latency_ms=row["total_latency_ms"],
-                    metadata=json.loads(row["metadata"]),
-                )
-                for row in rows
-            ]
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT * FROM runs ORDER BY timestamp DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [
+            BenchmarkRun(
+                id=row["id"],
+                timestamp=row["timestamp"],
+                mode=ExecutionMode(row["mode"]),
+                strategy=Strategy(row["strategy"]),
+                tasks_total=row["tasks_total"],
+                tasks_completed=row["tasks_completed"],
+                tasks_failed=row["tasks_failed"],
+                avg_score=row["avg_score"],
+                total_latency_ms=row["total_latency_ms"],
+                metadata=loads(row["metadata"]),
+            )
+            for row in rows
+        ]
 
     def export_results(self, run_id: str, output_path: Path, format: str = "json") -> None:
-        """Export results to file."""
-        results = self.get_results(run_id)
-        data = [r.model_dump() for r in results]
+        """Export results to file.
+
+        Rows are streamed from the cursor straight to the file, so memory use
+        does not grow with the size of the run, and encoded with pydantic's
+        serializer, the one behind `model_dump_json`.
+        """
+        rows = self._get_conn().execute(
+            """
+            SELECT task_id, run_id, strategy,
+                   COALESCE(actual_answer, '') as actual_answer,
+                   COALESCE(expected_answer, '') as expected_answer,
+                   score, latency_ms, tokens_used, error
+            FROM results WHERE run_id = ? ORDER BY id
+            """,
+            (run_id,),
+        )
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "json":
-            with open(output_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            # Same layout as json.dump(..., indent=2), one row at a time
+            with open(output_path, "wb") as f:
+                f.write(b"[")
+                empty = True
+                for row in rows:
+                    f.write(b"\n  " if empty else b",\n  ")
+                    f.write(to_json(dict(row), indent=2).replace(b"\n", b"\n  "))
+                    empty = False
+                f.write(b"]" if empty else b"\n]")
         elif format == "jsonl":
-            with open(output_path, "w") as f:
-                for item in data:
-                    f.write(json.dumps(item, default=str) + "\n")
+            with open(output_path, "wb") as f:
+                f.writelines(to_json(dict(row)) + b"\n" for row in rows)
         elif format == "csv":
             import csv
 
-            if data:
-                with open(output_path, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(data)
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(column[0] for column in rows.description)
+                writer.writerows(rows)
 
     def update_run_stats(self, run_id: str) -> None:
         """Update run statistics from results."""
-        with self._get_conn() as conn:
+        with self._transaction() as conn:
             stats = conn.execute(
                 """
                 SELECT
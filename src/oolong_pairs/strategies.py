@@ -1,15 +1,38 @@
 """Execution strategies for benchmark tasks."""
 
 import json
-import re
+import mmap
+import os
 import subprocess
 import tempfile
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
+from .claude import ClaudeSession, parse_json_output
 from .models import ExecutionMode, Result, Strategy, Task
 from .scoring import score_answer
+from .truncation import truncate_bytes
+
+# rlm-rs scratch files (database, chunks) live on tmpfs when
+# the host has one, so they never touch the disk
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Fixed prompt text is encoded once; task text is encoded and joined in
+_TRUNCATION_PROMPT_HEAD = b"Analyze the following data and answer the question.\n\n<context>\n"
+_TRUNCATION_PROMPT_QUESTION = b"\n</context>\n\nQuestion: "
+_TRUNCATION_PROMPT_TAIL = b"\n\nProvide only the answer, nothing else. Be concise."
+
+_CHUNK_PROMPT_HEAD = (
+    b"Analyze this chunk and extract any information relevant to the question.\n\n<chunk>\n"
+)
+_CHUNK_PROMPT_TAIL = b"\n</chunk>\n\nQuestion: "
+_CHUNK_PROMPT_FORMAT = (
+    b"\n\nRespond with JSON: "
+    b'{"relevant": true/false, "findings": "brief summary of relevant info or null"}'
+)
 
 
 class BaseStrategy(ABC):
@@ -37,35 +60,30 @@ class TruncationStrategy(BaseStrategy):
         self.mode = mode
         self.max_context_chars = max_context_chars
         self.model = model
+        self._session = ClaudeSession(model, "json", timeout=300)
 
-    def _truncate_context(self, context: str) -> str:
-        """Truncate context to max length, preserving beginning and end."""
-        if len(context) <= self.max_context_chars:
-            return context
+    def _truncate_context(self, context: bytes) -> bytes:
+        """Truncate encoded context to max length, preserving beginning and end.
 
+        The limit counts UTF-8 bytes, the same budget the SessionStart hook
+        applies, and cuts never split a character.
+        """
         # Keep first 60% and last 40%
-        first_part = int(self.max_context_chars * 0.6)
-        last_part = self.max_context_chars - first_part
-
-        return (
-            context[:first_part]
-            + "\n\n[... content truncated ...]\n\n"
-            + context[-last_part:]
+        return truncate_bytes(context, self.max_context_chars)
+
+    def _build_prompt(self, task: Task) -> bytes:
+        """Build the UTF-8 encoded prompt for Claude."""
+        truncated = self._truncate_context(task.context_path.read_bytes())
+        return b"".join(
+            [
+                _TRUNCATION_PROMPT_HEAD,
+                truncated,
+                _TRUNCATION_PROMPT_QUESTION,
+                task.question.encode(),
+                _TRUNCATION_PROMPT_TAIL,
+            ]
         )
 
-    def _build_prompt(self, task: Task) -> str:
-        """Build prompt for Claude."""
-        truncated = self._truncate_context(task.context)
-        return f"""Analyze the following data and answer the question.
-
-<context>
-{truncated}
-</context>
-
-Question: {task.question}
-
-Provide only the answer, nothing else. Be concise."""
-
     def execute(self, task: Task, run_id: str) -> Result:
         """Execute task using truncated context."""
         start_time = time.time()
@@ -101,26 +119,12 @@ Provide only the answer, nothing else. Be concise."""
         prompt = self._build_prompt(task)
 
         # Use claude CLI with --print for non-interactive mode
-        result = subprocess.run(
-            ["claude", "--print", "--model", self.model, "--output-format", "json"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        result = self._session.run(prompt)
 
         if result.returncode != 0:
-            raise RuntimeError(f"Claude CLI failed: {result.stderr}")
+            raise RuntimeError(f"Claude CLI failed: {result.stderr.decode(errors='replace')}")
 
-        # Parse JSON output
-        try:
-            output = json.loads(result.stdout)
-            answer = output.get("result", "").strip()
-            tokens = output.get("usage", {}).get("output_tokens", 0)
-            return answer, tokens
-        except json.JSONDecodeError:
-            # Fall back to raw output
-            return result.stdout.strip(), 0
+        return parse_json_output(result.stdout)
 
     def _execute_hooks(self, task: Task) -> tuple[str, int]:
         """Execute using hooks mode (placeholder)."""
@@ -141,12 +145,16 @@ class RLMRSStrategy(BaseStrategy):
         chunk_size: int = 150_000,
         model: str = "claude-sonnet-4-20250514",
         subcall_model: str = "claude-haiku-3-5-20241022",
+        subcall_concurrency: int = 8,
     ):
         self.mode = mode
         self.chunker = chunker
         self.chunk_size = chunk_size
         self.model = model
         self.subcall_model = subcall_model
+        self.subcall_concurrency = subcall_concurrency
+        self._session = ClaudeSession(model, "json", timeout=120)
+        self._subcall_session = ClaudeSession(subcall_model, "text", timeout=60)
 
     def execute(self, task: Task, run_id: str) -> Result:
         """Execute task using RLM-RS chunking."""
@@ -180,13 +188,9 @@ class RLMRSStrategy(BaseStrategy):
 
     def _execute_sdk(self, task: Task) -> tuple[str, int]:
         """Execute using RLM-RS CLI + Claude."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory(dir=SCRATCH_DIR) as tmpdir:
             tmpdir = Path(tmpdir)
 
-            # Write context to temp file
-            context_file = tmpdir / "context.txt"
-            context_file.write_text(task.context)
-
             # Initialize RLM-RS
             subprocess.run(
                 ["rlm-rs", "init", "--db-path", str(tmpdir / "rlm.db")],
@@ -194,12 +198,13 @@ class RLMRSStrategy(BaseStrategy):
                 capture_output=True,
             )
 
-            # Load context with chunking
+            # Load context with chunking, straight from the task's context
+            # file so it is never copied
             subprocess.run(
                 [
                     "rlm-rs",
                     "load",
-                    str(context_file),
+                    str(task.context_path),
                     "--name",
                     "context",
                     "--chunker",
@@ -230,48 +235,52 @@ class RLMRSStrategy(BaseStrategy):
                 capture_output=True,
             )
 
-            # Process each chunk with subcall
+            # Process chunks with concurrent subcalls; each one just waits on
+            # the CLI, and map() keeps findings in chunk order
             chunk_files = sorted(chunks_dir.glob("*.txt"))
             findings = []
 
-            for chunk_file in chunk_files:
-                chunk_result = self._process_chunk(chunk_file, task.question)
-                findings.append(chunk_result)
+            if chunk_files:
+                workers = min(self.subcall_concurrency, len(chunk_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    findings = list(
+                        pool.map(lambda cf: self._process_chunk(cf, task.question), chunk_files)
+                    )
 
             # Synthesize final answer
             answer, tokens = self._synthesize(task.question, findings)
             return answer, tokens
 
     def _process_chunk(self, chunk_file: Path, question: str) -> dict:
-        """Process a single chunk with subcall model."""
-        chunk_content = chunk_file.read_text()
-
-        prompt = f"""Analyze this chunk and extract any information relevant to the question.
-
-<chunk>
-{chunk_content}
-</chunk>
-
-Question: {question}
-
-Respond with JSON: {{"relevant": true/false, "findings": "brief summary of relevant info or null"}}"""
-
-        result = subprocess.run(
-            ["claude", "--print", "--model", self.subcall_model, "--output-format", "text"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        try:
-            # Extract JSON from response
-            text = result.stdout.strip()
-            json_match = re.search(r"\{[^}]+\}", text)
-            if json_match:
-                return json.loads(json_match.group())
-        except (json.JSONDecodeError, AttributeError):
-            pass
+        """Process a single chunk with subcall model.
+
+        The chunk is mapped and copied straight into the encoded prompt, so it
+        is never decoded to a str and re-encoded for the subprocess.
+        """
+        with open(chunk_file, "rb") as f:
+            # mmap cannot map an empty file
+            mapped = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if os.fstat(f.fileno()).st_size
+                else nullcontext(b"")
+            )
+            with mapped as chunk:
+                prompt = b"".join(
+                    [
+                        _CHUNK_PROMPT_HEAD,
+                        chunk,
+                        _CHUNK_PROMPT_TAIL,
+                        question.encode(),
+                        _CHUNK_PROMPT_FORMAT,
+                    ]
+                )
+
+        result = self._subcall_session.run(prompt)
+
+        # Extract JSON from response
+        finding = _extract_json_object(result.stdout.decode(errors="replace"))
+        if finding is not None:
+            return finding
 
         return {"relevant": False, "findings": None}
 
@@ -293,27 +302,36 @@ Question: {question}
 
 Provide only the answer, nothing else. Be concise."""
 
-        result = subprocess.run(
-            ["claude", "--print", "--model", self.model, "--output-format", "json"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-
-        try:
-            output = json.loads(result.stdout)
-            answer = output.get("result", "").strip()
-            tokens = output.get("usage", {}).get("output_tokens", 0)
-            return answer, tokens
-        except json.JSONDecodeError:
-            return result.stdout.strip(), 0
+        result = self._session.run(prompt.encode())
+        return parse_json_output(result.stdout)
 
     def _execute_hooks(self, task: Task) -> tuple[str, int]:
         """Execute using hooks mode (placeholder)."""
         raise NotImplementedError("Hooks mode requires external orchestration")
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> dict | None:
+    """Return the first JSON object embedded in model output, if any.
+
+    Decoding starts at each "{" in turn and stops at the end of the object,
+    so nested braces and trailing prose are handled in one C-level pass.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+        start = text.find("{", start + 1)
+    return None
+
+
 def get_strategy(
     strategy: Strategy,
     mode: ExecutionMode = ExecutionMode.SDK,
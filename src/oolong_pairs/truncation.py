@@ -0,0 +1,45 @@
+"""Head-and-tail truncation of UTF-8 encoded contexts.
+
+Shared by the truncation strategy and the SessionStart hook so both cut a
+context at the same places.
+"""
+
+import mmap
+
+TRUNCATION_MARKER = b"\n\n[... content truncated ...]\n\n"
+
+# Share of the byte budget kept from the start of the context; the rest is
+# kept from the end
+HEAD_FRACTION = 0.6
+
+
+def char_boundary(data: bytes | memoryview | mmap.mmap, index: int, step: int) -> int:
+    """Move index by step until it no longer splits a UTF-8 character."""
+    while 0 <= index < len(data) and data[index] & 0xC0 == 0x80:
+        index += step
+    return max(index, 0)
+
+
+def truncation_cuts(data: bytes | memoryview | mmap.mmap, max_bytes: int) -> tuple[int, int] | None:
+    """Get the end of the kept head and start of the kept tail.
+
+    Returns None when the data fits in max_bytes. Each cut is moved to the
+    nearest character boundary inside the kept region, so the parts decode
+    cleanly.
+    """
+    size = len(data)
+    if size <= max_bytes:
+        return None
+
+    first_part = int(max_bytes * HEAD_FRACTION)
+    last_part = max_bytes - first_part
+    return char_boundary(data, first_part, -1), char_boundary(data, size - last_part, 1)
+
+
+def truncate_bytes(data: bytes, max_bytes: int) -> bytes:
+    """Truncate encoded text to max_bytes, keeping its beginning and end."""
+    cuts = truncation_cuts(data, max_bytes)
+    if cuts is None:
+        return data
+    head_end, tail_start = cuts
+    return data[:head_end] + TRUNCATION_MARKER + data[tail_start:]
@@ -0,0 +1,38 @@
+"""Tests for Claude CLI invocation."""
+
+import os
+import sys
+
+from oolong_pairs.claude import ClaudeSession
+
+# Lists the descriptors open in the child; probing with fstat opens none
+LIST_FDS = """
+import os
+fds = []
+for fd in range(256):
+    try:
+        os.fstat(fd)
+    except OSError:
+        continue
+    fds.append(fd)
+print(fds)
+"""
+
+
+class TestClaudeSession:
+    """Tests for running the CLI."""
+
+    def test_child_sees_only_standard_fds(self):
+        session = ClaudeSession("sonnet")
+        session._args = [sys.executable, "-c", LIST_FDS]
+        read_fd, write_fd = os.pipe()
+        os.set_inheritable(read_fd, True)
+        os.set_inheritable(write_fd, True)
+        try:
+            completed = session.run("")
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip() == "[0, 1, 2]"
@@ -0,0 +1,105 @@
+"""Tests for the benchmark CLI."""
+
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from oolong_pairs import cli as cli_module
+from oolong_pairs.models import AnswerType, Result, Strategy, Task
+from oolong_pairs.storage import Storage
+
+
+def make_task(index: int) -> Task:
+    return Task(
+        id=f"task{index}",
+        dataset="trec_coarse",
+        context_path=Path("/dev/null"),
+        question="q",
+        expected_answer="cat",
+        answer_type=AnswerType.LABEL,
+    )
+
+
+class FakeStrategy:
+    """Strategy that answers every task at once, or after `release` is set."""
+
+    def __init__(self, blocking: set[str] = frozenset()):
+        self.blocking = blocking
+        self.release = threading.Event()
+        self.started: list[str] = []
+
+    def execute(self, task: Task, run_id: str) -> Result:
+        self.started.append(task.id)
+        if task.id in self.blocking:
+            self.release.wait(timeout=10)
+        return Result(
+            task_id=task.id,
+            run_id=run_id,
+            strategy=Strategy.TRUNCATION,
+            actual_answer="cat",
+            expected_answer="cat",
+            score=1.0,
+            latency_ms=1.0,
+        )
+
+
+@pytest.fixture
+def run_cli(tmp_path, monkeypatch):
+    """Invoke `run` against fake tasks and strategy; returns the saved batches."""
+    db_path = tmp_path / "benchmark.db"
+    batches: list[list[str]] = []
+    save_results = Storage.save_results
+
+    def record(self, results):
+        if results:
+            batches.append([r.task_id for r in results])
+        save_results(self, results)
+
+    monkeypatch.setattr(Storage, "save_results", record)
+    monkeypatch.setattr(cli_module.Storage, "update_run_stats", lambda self, run_id: None)
+
+    def invoke(tasks, strategy, *args):
+        monkeypatch.setattr(cli_module, "load_oolong_tasks", lambda **kwargs: tasks)
+        monkeypatch.setattr(cli_module, "get_strategy", lambda *a, **kw: strategy)
+        result = CliRunner().invoke(
+            cli_module.cli,
+            ["--db", str(db_path), "run", "--strategy", "truncation", *args],
+        )
+        return result, batches
+
+    return invoke
+
+
+class TestRun:
+    """Tests for the run command."""
+
+    def test_flushes_results_in_batches(self, run_cli):
+        tasks = [make_task(i) for i in range(5)]
+
+        _, batches = run_cli(tasks, FakeStrategy(), "--flush-every", "2")
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert sorted(sum(batches, [])) == [task.id for task in tasks]
+
+    def test_interrupt_cancels_queued_tasks_and_saves_running_ones(self, run_cli, monkeypatch):
+        tasks = [make_task(i) for i in range(10)]
+        strategy = FakeStrategy(blocking={task.id for task in tasks[1:]})
+        print_ = cli_module.console.print
+
+        def interrupt_on_first_result(*args, **kwargs):
+            if args and "Task task0:" in str(args[0]):
+                # Tasks the workers picked up are still running when the
+                # interrupt lands
+                strategy.release.set()
+                raise KeyboardInterrupt
+            print_(*args, **kwargs)
+
+        monkeypatch.setattr(cli_module.console, "print", interrupt_on_first_result)
+
+        result, batches = run_cli(tasks, strategy, "--concurrency", "2")
+
+        assert result.exit_code != 0
+        assert len(strategy.started) < len(tasks)
+        assert sorted(sum(batches, [])) == sorted(strategy.started)
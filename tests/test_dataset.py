@@ -0,0 +1,115 @@
+"""Tests for dataset loading and the filtered row cache."""
+
+import pyarrow as pa
+import pytest
+from datasets import Dataset
+
+from oolong_pairs import dataset
+from oolong_pairs.models import AnswerType
+from oolong_pairs.scoring import map_answer_type_str
+
+
+def make_rows():
+    return [
+        {
+            "id": f"row{i}",
+            "dataset": "trec_coarse",
+            "context_window_text": f"context {i} é",
+            "question": "q",
+            "answer": "['cat']",
+            "answer_type": "LABEL",
+            "context_length": 11,
+        }
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def streamed(monkeypatch):
+    """Replace the HuggingFace stream; returns the number of times it ran."""
+    calls = []
+
+    def iter_rows(dataset_filter, split, min_context_length):
+        calls.append(dataset_filter)
+        yield from make_rows()
+
+    monkeypatch.setattr(dataset, "_iter_dataset_rows", iter_rows)
+    return calls
+
+
+def load(tmp_path):
+    return dataset.load_oolong_tasks(
+        context_dir=tmp_path / "contexts", cache_dir=tmp_path / "cache"
+    )
+
+
+class TestRowCache:
+    """Tests for the Arrow IPC row cache."""
+
+    def test_second_load_reads_cache(self, tmp_path, streamed):
+        first = load(tmp_path)
+        second = load(tmp_path)
+
+        assert len(streamed) == 1
+        assert second == first
+        assert second[0].context == "context 0 é"
+
+    def test_cache_does_not_store_contexts(self, tmp_path, streamed):
+        load(tmp_path)
+
+        (cache_file,) = (tmp_path / "cache").glob("*.arrow")
+        with pa.memory_map(str(cache_file)) as source:
+            schema = pa.ipc.open_file(source).schema
+        assert "context_window_text" not in schema.names
+        assert "context_length" in schema.names
+
+    def test_missing_context_file_rebuilds_cache(self, tmp_path, streamed):
+        tasks = load(tmp_path)
+        tasks[1].context_path.unlink()
+
+        reloaded = load(tmp_path)
+
+        assert len(streamed) == 2
+        assert reloaded[1].context == "context 1 é"
+
+
+class TestMapAnswerType:
+    """Tests for mapping dataset answer types."""
+
+    def test_matches_scoring_mapping(self):
+        for value in ("NUMERIC", "NUMERIC_ONE_CLASS", "DATE_X", "comparison", "OTHER"):
+            assert dataset.map_answer_type(value) == map_answer_type_str(value)
+        assert dataset.map_answer_type("DATE_X") == AnswerType.DATE
+
+
+class TestGetDatasetStats:
+    """Tests for streamed dataset statistics."""
+
+    def test_streams_split_in_arrow_batches(self, monkeypatch):
+        rows = {
+            "dataset": ["trec_coarse", "other", "trec_coarse", "trec_coarse"],
+            "task": ["count", "count", "compare", "count"],
+            "answer_type": ["LABEL", "LABEL", "NUMERIC", "LABEL"],
+            "context_window_text": ["ab", "abcdefgh", "é" * 5, "abcd"],
+            "question": ["q"] * 4,
+        }
+        calls = []
+
+        def load_stream(name, split, **kwargs):
+            calls.append(kwargs)
+            return Dataset.from_dict(rows).to_iterable_dataset()
+
+        monkeypatch.setattr(dataset, "load_dataset", load_stream)
+        monkeypatch.setattr(dataset, "STATS_BATCH_SIZE", 3)
+
+        stats = dataset.get_dataset_stats()
+
+        assert calls == [{"streaming": True}]
+        assert stats == {
+            "total_in_split": 4,
+            "filtered_count": 3,
+            "dataset_filter": "trec_coarse",
+            "context_length": {"min": 2, "max": 5, "avg": 11 / 3},
+            "task_types": {"count": 2, "compare": 1},
+            "answer_types": {"LABEL": 2, "NUMERIC": 1},
+        }
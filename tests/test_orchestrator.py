@@ -0,0 +1,137 @@
+"""Tests for the hooks orchestrator."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from oolong_pairs import orchestrator as orchestrator_module
+from oolong_pairs.models import AnswerType, Strategy, Task
+from oolong_pairs.orchestrator import HooksOrchestrator
+from oolong_pairs.state import get_state_file, write_state
+from oolong_pairs.storage import Storage
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    return HooksOrchestrator(
+        Strategy.TRUNCATION, tmp_path / "benchmark.db", state_dir=tmp_path / "state"
+    )
+
+
+def make_task(index: int) -> Task:
+    return Task(
+        id=f"task{index}",
+        dataset="trec_coarse",
+        context_path=Path("/dev/null"),
+        question="q",
+        expected_answer="cat",
+        answer_type=AnswerType.LABEL,
+    )
+
+
+def complete_later(state_dir, delay: float = 0.2) -> threading.Thread:
+    """Mark the task in `state_dir` completed after `delay` seconds, as the Stop hook does."""
+
+    def complete():
+        time.sleep(delay)
+        write_state(get_state_file(state_dir), {"status": "completed", "score": 1.0})
+
+    thread = threading.Thread(target=complete)
+    thread.start()
+    return thread
+
+
+class TestWaitForCompletion:
+    """Tests for waiting on a task's state file."""
+
+    @pytest.fixture
+    def state_dir(self, orchestrator):
+        state_dir = orchestrator._task_state_dir("run1", 0)
+        write_state(get_state_file(state_dir), {"status": "in_progress"})
+        return state_dir
+
+    def test_state_file_write_wakes_waiter(self, orchestrator, state_dir):
+        pytest.importorskip("watchdog")
+        thread = complete_later(state_dir)
+
+        with orchestrator._watch_state_files(state_dir.parent):
+            start = time.monotonic()
+            state = orchestrator._wait_for_completion(state_dir, timeout=10)
+            elapsed = time.monotonic() - start
+        thread.join()
+
+        assert state == {"status": "completed", "score": 1.0}
+        # Well under the 2 s poll interval used alongside file events
+        assert elapsed < 1.5
+
+    def test_polls_without_watchdog(self, orchestrator, state_dir, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "Observer", None)
+        thread = complete_later(state_dir)
+
+        with orchestrator._watch_state_files(state_dir.parent):
+            state = orchestrator._wait_for_completion(state_dir, timeout=10)
+        thread.join()
+
+        assert state == {"status": "completed", "score": 1.0}
+
+    def test_missing_state_file_returns_none(self, orchestrator, state_dir):
+        get_state_file(state_dir).unlink()
+
+        assert orchestrator._wait_for_completion(state_dir, timeout=1) is None
+
+    def test_times_out(self, orchestrator, state_dir):
+        assert orchestrator._wait_for_completion(state_dir, timeout=0.1) is None
+
+
+class TestRunBenchmark:
+    """Tests for running tasks through the worker pool."""
+
+    def test_runs_tasks_in_parallel(self, orchestrator, monkeypatch):
+        tasks = [make_task(i) for i in range(6)]
+        orchestrator.parallelism = 3
+        # Every task waits until three are running at once
+        barrier = threading.Barrier(3, timeout=10)
+        ran = []
+
+        def run_task(task, run_id, index):
+            barrier.wait()
+            ran.append((task.id, index))
+            return {"status": "completed", "score": 1.0}
+
+        monkeypatch.setattr(orchestrator_module, "load_oolong_tasks", lambda **kwargs: tasks)
+        monkeypatch.setattr(orchestrator, "_run_task", run_task)
+
+        run_id = orchestrator.run_benchmark(limit=len(tasks))
+
+        assert sorted(ran) == [(task.id, i) for i, task in enumerate(tasks)]
+        assert not (orchestrator.state_dir / run_id).exists()
+        storage = Storage(orchestrator.db_path)
+        try:
+            assert storage.get_run(run_id) is not None
+        finally:
+            storage.close()
+
+    def test_error_cancels_queued_tasks(self, orchestrator, monkeypatch):
+        tasks = [make_task(i) for i in range(10)]
+        orchestrator.parallelism = 2
+        release = threading.Event()
+        started = []
+
+        def run_task(task, run_id, index):
+            started.append(task.id)
+            if index == 0:
+                # Let the running task finish once the error has been raised
+                threading.Timer(0.2, release.set).start()
+                raise RuntimeError("session failed")
+            release.wait(timeout=10)
+            return None
+
+        monkeypatch.setattr(orchestrator_module, "load_oolong_tasks", lambda **kwargs: tasks)
+        monkeypatch.setattr(orchestrator, "_run_task", run_task)
+
+        with pytest.raises(RuntimeError, match="session failed"):
+            orchestrator.run_benchmark(limit=len(tasks))
+
+        assert len(started) < len(tasks)
@@ -1,7 +1,11 @@
 """Tests for scoring logic."""
 
+import numpy as np
+import pytest
+
 from oolong_pairs.models import AnswerType
 from oolong_pairs.scoring import (
+    ANSWER_TYPE_CODES,
     comparison_score,
     detect_answer_type,
     label_score,
@@ -10,6 +14,7 @@ from oolong_pairs.scoring import (
     numeric_score,
     parse_numeric,
     score_answer,
+    score_answers_batch,
 )
 
 
@@ -21,6 +26,7 @@ class TestNormalizeAnswer:
 
     def test_lowercases(self):
         assert normalize_answer("HELLO") == "hello"
+        assert normalize_answer("STRASSE") == normalize_answer("straße")
 
     def test_removes_markdown(self):
         assert normalize_answer("**bold**") == "bold"
@@ -112,6 +118,17 @@ class TestComparisonScore:
         assert comparison_score("more", "less") == 0.0
         assert comparison_score("same", "more") == 0.0
 
+    def test_matches_whole_words(self):
+        assert comparison_score("more", "More.") == 1.0
+        assert comparison_score("less", "Lessons learned") == 0.0
+        # Substrings of longer words no longer categorize
+        assert comparison_score("less", "lesser") == 0.0
+        assert comparison_score("less", "unless") == 0.0
+
+    def test_underscore_separates_words(self):
+        assert comparison_score("more", "more_common") == 1.0
+        assert comparison_score("less", "**less**") == 1.0
+
 
 class TestDetectAnswerType:
     """Tests for automatic answer type detection."""
@@ -120,6 +137,8 @@ class TestDetectAnswerType:
         assert detect_answer_type("42") == AnswerType.NUMERIC
         assert detect_answer_type("3.14") == AnswerType.NUMERIC
         assert detect_answer_type("1,234") == AnswerType.NUMERIC
+        assert detect_answer_type("1_000") == AnswerType.NUMERIC
+        assert detect_answer_type("١٢") == AnswerType.NUMERIC
 
     def test_detects_comparison(self):
         assert detect_answer_type("more common") == AnswerType.COMPARISON
@@ -129,6 +148,12 @@ class TestDetectAnswerType:
     def test_defaults_to_label(self):
         assert detect_answer_type("cat") == AnswerType.LABEL
         assert detect_answer_type("hello world") == AnswerType.LABEL
+        assert detect_answer_type("furthermore") == AnswerType.LABEL
+        assert detect_answer_type("lesser") == AnswerType.LABEL
+        assert detect_answer_type("unless") == AnswerType.LABEL
+
+    def test_detects_underscored_comparison(self):
+        assert detect_answer_type("more_common") == AnswerType.COMPARISON
 
 
 class TestMapAnswerTypeStr:
@@ -187,3 +212,54 @@ class TestScoreAnswer:
     def test_empty_answer_returns_zero(self):
         assert score_answer("42", "", AnswerType.NUMERIC) == 0.0
         assert score_answer("cat", "  ", AnswerType.LABEL) == 0.0
+
+
+class TestScoreAnswersBatch:
+    """Tests for batch scoring."""
+
+    def test_matches_score_answer(self):
+        expected = ["10", "cat", "more", "42", "7"]
+        actual = ["12", "Cat", "fewer", "", "seven"]
+        types = [AnswerType.NUMERIC, AnswerType.LABEL, None, AnswerType.NUMERIC, None]
+
+        scores = score_answers_batch(expected, actual, types)
+
+        assert scores.tolist() == [
+            score_answer(e, a, t) for e, a, t in zip(expected, actual, types, strict=True)
+        ]
+        assert scores[0] == 0.75**2
+
+    def test_accepts_array_columns(self):
+        expected = np.array(["10", "cat", "more"])
+        actual = np.array(["10", "dog", "greater"])
+
+        assert score_answers_batch(expected, actual).tolist() == [1.0, 0.0, 1.0]
+
+    def test_accepts_answer_type_codes(self):
+        expected = ["10", "cat", "more", "42", "7"]
+        actual = ["12", "Cat", "fewer", "", "seven"]
+        types = [AnswerType.NUMERIC, AnswerType.LABEL, None, AnswerType.NUMERIC, None]
+        codes = np.array([-1 if t is None else ANSWER_TYPE_CODES[t] for t in types], dtype=np.int8)
+
+        scores = score_answers_batch(expected, actual, codes)
+
+        assert scores.tolist() == score_answers_batch(expected, actual, types).tolist()
+        assert codes.tolist() == [0, 1, -1, 0, -1]
+
+    def test_rejects_unknown_answer_type_codes(self):
+        with pytest.raises(ValueError, match="unknown answer type code"):
+            score_answers_batch(["1"], ["1"], np.array([len(AnswerType)], dtype=np.int8))
+
+    def test_nan_answers_match_score_answer(self):
+        expected = ["nan", "nan", "5"]
+        actual = ["nan", "5", "five"]
+        types = [AnswerType.NUMERIC] * 3
+
+        scores = score_answers_batch(expected, actual, types)
+
+        scalar = [score_answer(e, a, t) for e, a, t in zip(expected, actual, types, strict=True)]
+        assert np.array_equal(scores, scalar, equal_nan=True)
+        assert np.isnan(scores[:2]).all()
+
+    def test_empty_batch(self):
+        assert score_answers_batch([], [], []).size == 0
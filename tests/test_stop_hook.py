@@ -0,0 +1,60 @@
+"""Tests for the Stop hook's answer extraction."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).parent.parent / "hooks" / "stop.py"
+
+
+@pytest.fixture(scope="module")
+def stop_hook():
+    spec = importlib.util.spec_from_file_location("stop_hook", HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestExtractAnswer:
+    """Tests for pulling the final answer out of session data."""
+
+    def test_last_answer_line_wins(self, stop_hook):
+        summary = "ANSWER: 1\nOn reflection, that was wrong.\nANSWER: 2"
+
+        assert stop_hook.extract_answer({"final_summary": summary}) == "2"
+
+    def test_later_mixed_case_answer_line_wins(self, stop_hook):
+        summary = "ANSWER: 1\nblah\nAnswer: 2"
+
+        assert stop_hook.extract_answer({"final_summary": summary}) == "2"
+
+    def test_inline_answer_is_not_an_answer_line(self, stop_hook):
+        summary = "answer: cat\nfoo ANSWER: dog"
+
+        assert stop_hook.extract_answer({"final_summary": summary}) == "cat"
+
+    def test_empty_answer_line_falls_back_to_summary(self, stop_hook):
+        summary = "I could not decide.\nANSWER:  \n"
+
+        assert stop_hook.extract_answer({"final_summary": summary}) == summary.strip()
+
+    def test_no_answer_line_returns_summary(self, stop_hook):
+        summary = "  The answer is probably 42.\n"
+
+        assert stop_hook.extract_answer({"final_summary": summary}) == "The answer is probably 42."
+
+    def test_transcript_fallback(self, stop_hook):
+        session_data = {
+            "transcript": [
+                {"role": "assistant", "content": "ANSWER: early"},
+                {"role": "user", "content": "ANSWER: not the model"},
+                {"role": "assistant", "content": [{"type": "text", "text": "ANSWER: cat"}]},
+            ]
+        }
+
+        assert stop_hook.extract_answer(session_data) == "cat"
+
+    def test_empty_session_returns_empty_answer(self, stop_hook):
+        assert stop_hook.extract_answer({}) == ""
+        assert stop_hook.extract_answer({"final_summary": "", "transcript": []}) == ""
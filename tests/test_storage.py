@@ -0,0 +1,138 @@
+"""Tests for SQLite storage."""
+
+import csv
+import json
+
+import pytest
+
+from oolong_pairs.models import BenchmarkRun, ExecutionMode, Result, RunSummary, Strategy
+from oolong_pairs.storage import Storage
+
+
+def make_result(
+    task_id: str, score: float = 1.0, error: str | None = None, answer: str = "cat"
+) -> Result:
+    return Result(
+        task_id=task_id,
+        run_id="run1",
+        strategy=Strategy.TRUNCATION,
+        actual_answer=answer,
+        expected_answer="cat",
+        score=score,
+        latency_ms=12.5,
+        tokens_used=3,
+        error=error,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = Storage(tmp_path / "benchmark.db")
+    storage.save_run(BenchmarkRun(id="run1", mode=ExecutionMode.SDK, strategy=Strategy.TRUNCATION))
+    yield storage
+    storage.close()
+
+
+class TestSaveResults:
+    """Tests for batched result inserts."""
+
+    def test_saves_all_results_in_order(self, storage):
+        results = [make_result("t1"), make_result("t2", 0.5), make_result("t3", 0.0, "boom")]
+
+        storage.save_results(results)
+
+        assert storage.get_results("run1") == results
+
+    def test_empty_batch_is_a_no_op(self, storage):
+        storage.save_results([])
+
+        assert storage.get_results("run1") == []
+
+    def test_batches_accumulate(self, storage):
+        storage.save_results([make_result("t1")])
+        storage.save_results([make_result("t2"), make_result("t3")])
+        storage.save_result(make_result("t4"))
+
+        assert [r.task_id for r in storage.get_results("run1")] == ["t1", "t2", "t3", "t4"]
+
+
+class TestGetRunSummary:
+    """Tests for the aggregated run summary."""
+
+    def test_missing_run(self, storage):
+        assert storage.get_run_summary("missing") is None
+
+    def test_empty_run(self, storage):
+        assert storage.get_run_summary("run1") == RunSummary(
+            run_id="run1",
+            strategy=Strategy.TRUNCATION,
+            mode=ExecutionMode.SDK,
+            tasks_completed=0,
+            tasks_failed=0,
+            avg_score=0.0,
+            min_score=0.0,
+            max_score=0.0,
+            total_latency_ms=0.0,
+            avg_latency_ms=0.0,
+        )
+
+    def test_mixed_run(self, storage):
+        storage.save_results(
+            [make_result("t1", 1.0), make_result("t2", 0.5), make_result("t3", 0.0, "boom")]
+        )
+
+        summary = storage.get_run_summary("run1")
+
+        assert summary.tasks_completed == 2
+        assert summary.tasks_failed == 1
+        # Failed tasks count towards latency but not towards scores
+        assert (summary.avg_score, summary.min_score, summary.max_score) == (0.75, 0.5, 1.0)
+        assert summary.total_latency_ms == 37.5
+        assert summary.avg_latency_ms == 12.5
+
+
+class TestExportResults:
+    """Tests for exporting a run's results."""
+
+    @pytest.fixture
+    def results(self, storage):
+        results = [make_result("t1", answer="café"), make_result("t2", 0.0, "boom")]
+        storage.save_results(results)
+        return [result.model_dump(mode="json") for result in results]
+
+    def test_json(self, storage, results, tmp_path):
+        output = tmp_path / "out.json"
+
+        storage.export_results("run1", output, "json")
+
+        text = output.read_text(encoding="utf-8")
+        assert text == json.dumps(results, indent=2, ensure_ascii=False)
+        assert "café" in text
+
+    def test_jsonl(self, storage, results, tmp_path):
+        output = tmp_path / "out.jsonl"
+
+        storage.export_results("run1", output, "jsonl")
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert lines == [json.dumps(r, ensure_ascii=False, separators=(",", ":")) for r in results]
+
+    def test_csv(self, storage, results, tmp_path):
+        output = tmp_path / "out.csv"
+
+        storage.export_results("run1", output, "csv")
+
+        with open(output, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["task_id"] for row in rows] == ["t1", "t2"]
+        assert rows[0]["actual_answer"] == "café"
+        assert rows[1]["error"] == "boom"
+
+    def test_empty_run(self, storage, tmp_path):
+        for format in ("json", "jsonl", "csv"):
+            storage.export_results("run1", tmp_path / f"out.{format}", format)
+
+        assert json.loads((tmp_path / "out.json").read_text()) == []
+        assert (tmp_path / "out.jsonl").read_text() == ""
+        header = (tmp_path / "out.csv").read_text().strip()
+        assert header.split(",")[:3] == ["task_id", "run_id", "strategy"]
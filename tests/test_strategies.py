@@ -0,0 +1,32 @@
+"""Tests for execution strategy helpers."""
+
+from oolong_pairs.strategies import _extract_json_object
+
+
+class TestExtractJsonObject:
+    """Tests for pulling a chunk finding out of model output."""
+
+    def test_plain_object(self):
+        assert _extract_json_object('{"relevant": false}') == {"relevant": False}
+
+    def test_nested_object(self):
+        text = '{"relevant": true, "findings": {"label": "cat", "count": 3}}'
+
+        assert _extract_json_object(text) == {
+            "relevant": True,
+            "findings": {"label": "cat", "count": 3},
+        }
+
+    def test_braces_inside_strings(self):
+        text = '{"relevant": true, "findings": "uses {braces} and a stray }"}'
+
+        assert _extract_json_object(text)["findings"] == "uses {braces} and a stray }"
+
+    def test_skips_stray_brace_and_prose(self):
+        text = 'Sure {not json. Here it is:\n{"relevant": true, "findings": "x"}\nDone.'
+
+        assert _extract_json_object(text) == {"relevant": True, "findings": "x"}
+
+    def test_no_object(self):
+        assert _extract_json_object("no json here") is None
+        assert _extract_json_object("[1, 2]") is None
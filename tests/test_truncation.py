@@ -0,0 +1,63 @@
+"""Tests for UTF-8 safe head-and-tail truncation."""
+
+from oolong_pairs.truncation import (
+    TRUNCATION_MARKER,
+    char_boundary,
+    truncate_bytes,
+    truncation_cuts,
+)
+
+# "é" is 2 bytes and straddles the head cut at byte 6 of a 10-byte budget;
+# "€" is 3 bytes and straddles the tail cut 4 bytes from the end
+STRADDLING = "abcdeé0123456789€yz".encode()
+
+
+class TestCharBoundary:
+    """Tests for moving an index off UTF-8 continuation bytes."""
+
+    def test_keeps_boundary_index(self):
+        assert char_boundary(STRADDLING, 5, -1) == 5
+        assert char_boundary(STRADDLING, 5, 1) == 5
+
+    def test_moves_back_to_character_start(self):
+        assert char_boundary(STRADDLING, 6, -1) == 5
+
+    def test_moves_forward_past_character(self):
+        assert char_boundary(STRADDLING, 18, 1) == 20
+
+
+class TestTruncationCuts:
+    """Tests for choosing the head and tail cuts."""
+
+    def test_under_limit_is_not_cut(self):
+        assert truncation_cuts(b"short", 10) is None
+
+    def test_exact_limit_is_not_cut(self):
+        assert truncation_cuts(b"0123456789", 10) is None
+
+    def test_cuts_move_off_multibyte_characters(self):
+        assert truncation_cuts(STRADDLING, 10) == (5, 20)
+
+
+class TestTruncateBytes:
+    """Tests for truncating encoded text."""
+
+    def test_under_limit_returns_data(self):
+        assert truncate_bytes(b"short", 10) == b"short"
+
+    def test_exact_limit_returns_data(self):
+        assert truncate_bytes("héllo".encode(), 6) == "héllo".encode()
+
+    def test_keeps_head_and_tail_without_splitting_characters(self):
+        truncated = truncate_bytes(STRADDLING, 10)
+
+        assert truncated == b"abcde" + TRUNCATION_MARKER + b"yz"
+        truncated.decode()
+
+    def test_keeps_whole_characters_at_the_cuts(self):
+        data = ("é" * 20).encode()
+
+        head, tail = truncate_bytes(data, 11).split(TRUNCATION_MARKER)
+
+        assert head.decode() == "ééé"
+        assert tail.decode() == "éé"